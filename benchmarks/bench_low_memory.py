@@ -0,0 +1,99 @@
+"""Peak RSS of retained vs streamed command results across fleet sizes
+
+For each fleet size, feeds that many synthetic multi-MB host results
+through StreamingResultWriter, the way --low-memory does, and through a
+retained path that keeps every result until the run ends, as a plain
+nr.run does. Each measurement runs in its own process so the peaks are
+independent. The streaming peak should stay flat as the fleet grows.
+
+    python benchmarks/bench_low_memory.py --hosts 25 50 100 200 --size-mb 2
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.services.streaming import StreamingResultWriter
+
+COMMAND = "show running-config"
+
+class FakeHost:
+    def __init__(self, name):
+        self.name = name
+
+class FakeResult:
+    def __init__(self, result):
+        self.result = result
+        self.scrapli_response = None
+
+class FakeMultiResult(list):
+    """The parts of a Nornir MultiResult that the writer touches"""
+    failed = False
+    exception = None
+
+def synthetic_output(index: int, size_mb: int) -> str:
+    line = f"hostname host{index:05d} " + "x" * 57 + "\n"
+    return line * (size_mb * 1024 * 1024 // len(line))
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def save(output_dir: str, host, multi_result) -> str:
+    output = multi_result[0].result
+    with open(os.path.join(output_dir, f"{host.name}.txt"), "w") as f:
+        f.write(output)
+    return output
+
+def run_path(path: str, hosts: int, size_mb: int) -> None:
+    """Run one path and print its peak RSS in MB"""
+    with tempfile.TemporaryDirectory() as output_dir:
+        if path == "streaming":
+            writer = StreamingResultWriter(COMMAND, lambda host, result: save(output_dir, host, result))
+            for index in range(hosts):
+                host = FakeHost(f"host{index:05d}")
+                result = FakeMultiResult([FakeResult(synthetic_output(index, size_mb))])
+                writer.task_instance_completed(None, host, result)
+            kept = writer.records
+        else:
+            # nr.run returns every host's result before any is saved
+            kept = {}
+            for index in range(hosts):
+                host = FakeHost(f"host{index:05d}")
+                kept[host] = FakeMultiResult([FakeResult(synthetic_output(index, size_mb))])
+            for host, result in kept.items():
+                save(output_dir, host, result)
+        assert len(kept) == hosts
+    print(f"{peak_rss_mb():.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare peak RSS of retained and streamed results")
+    parser.add_argument("--hosts", type=int, nargs="+", default=[25, 50, 100, 200],
+                        help="Fleet sizes to sweep")
+    parser.add_argument("--size-mb", type=int, default=2, help="Output size per host in MB")
+    parser.add_argument("--path", choices=["retained", "streaming"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.path:
+        run_path(args.path, args.hosts[0], args.size_mb)
+        return
+
+    print(f"Peak RSS for {args.size_mb} MB of '{COMMAND}' output per host")
+    print(f"{'hosts':>6} {'total MB':>9} {'retained MB':>12} {'streaming MB':>13}")
+    for hosts in args.hosts:
+        peaks = {}
+        for path in ("retained", "streaming"):
+            run = subprocess.run(
+                [sys.executable, __file__, "--path", path, "--hosts", str(hosts), "--size-mb", str(args.size_mb)],
+                check=True, capture_output=True, text=True
+            )
+            peaks[path] = float(run.stdout.strip())
+        print(f"{hosts:>6} {hosts * args.size_mb:>9} {peaks['retained']:>12.1f} {peaks['streaming']:>13.1f}")
+
+if __name__ == "__main__":
+    main()
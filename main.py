@@ -9,7 +9,20 @@ import os
 from dotenv import load_dotenv
 import json
 import importlib
-from shared.services.mod import get_commands_for_task, AVAILABLE_TASKS, VENDOR_COMMANDS
+import contextlib
+import threading
+import time
+from shared.services.mod import get_commands_for_task, get_task_type, get_worker_module, get_watch_probe, TaskType, AVAILABLE_TASKS, VENDOR_COMMANDS
+from shared.services.parsers import get_parser
+from shared.services.store import ResultStore
+from shared.services.timings import CommandTimings, configured_timeout, elapsed_time
+from shared.services.ssh import enable_connection_reuse
+from shared.services.cache import ResultCache
+from shared.services.streaming import StreamingResultWriter
+from shared.services.profiling import PhaseProfiler
+from shared.services.watch import WATCH_SKIPPED_COMMANDS, command_state, neighbor_state, diff_state, write_event
+from shared.services.polling import stagger_offsets, poll_host
+from scrapli.exceptions import ScrapliTimeout
 
 class Yapom:
     def __init__(
@@ -19,7 +32,15 @@ class Yapom:
         devices=None, 
         platform=None,
         login_user=None,
-        task=None
+        task=None,
+        parse_store=None,
+        ssh_persist=None,
+        use_cache=True,
+        max_age=None,
+        low_memory=False,
+        watch_interval=None,
+        watch_jitter=None,
+        profile=False
     ):
         self.site = site
         self.role = role
@@ -27,11 +48,31 @@ class Yapom:
         self.platform = platform
         self.login_user = login_user
         self.task = task
+        self.parse_store = parse_store
+        self.ssh_persist = ssh_persist
+        self.use_cache = use_cache
+        self.max_age = max_age
+        self.cache = None
+        self.low_memory = low_memory
+        self.watch_interval = watch_interval
+        self.watch_jitter = watch_jitter
+        self.profiler = PhaseProfiler() if profile else None
+        self.lock = threading.Lock()
+        self.store = None
         self.output_counter = 0
+        self.record_counter = 0
+        self.failed_hosts = set()
+        self.timings = CommandTimings("output/command_timings.json")
 
         load_dotenv()
         self.login_password = os.getenv('NETWORK_PASSWORD')
 
+    def phase(self, name: str):
+        """Profile a block of the run when --profile is set"""
+        if self.profiler:
+            return self.profiler.phase(name)
+        return contextlib.nullcontext()
+
     def verify_connectivity(self, nr):
         print("\nVerifying device connectivity...")
         print("=" * 50)
@@ -44,6 +85,7 @@ class Yapom:
         
         accessible = []
         inaccessible = []
+        fresh = []
         
         for hostname, result in results.items():
             device = nr.inventory.hosts[hostname]
@@ -56,6 +98,12 @@ class Yapom:
                 print(f"✓ {hostname} ({device.hostname})")
                 print(f"  {version_info.strip()}")
                 accessible.append(hostname)
+                fresh.append((hostname, device.platform, str(result.result)))
+        
+        # Reachability is always checked live; the output can still serve a
+        # later 'show version' command from the cache
+        if self.cache:
+            self.cache.put_many("show version", fresh)
         
         print("\nConnectivity Summary")
         print("=" * 50)        
@@ -72,15 +120,20 @@ class Yapom:
         
         return nr.filter(filter_func=lambda h: h.name in accessible)
 
-    def save_output(self, hostname: str, command: str, output: str, timestamp: str, task_name: str) -> None:
+    def save_output(self, hostname: str, command: str, output: str, timestamp: str, task_name: str, stored_at: float = None) -> None:
         try:
+            header = f"Command: {command}\n"
+            if stored_at is not None:
+                # Served from the result cache, not queried in this run
+                header += f"Cached: {time.time() - stored_at:.0f}s old (stored {datetime.fromtimestamp(stored_at):%Y-%m-%d %H:%M:%S})\n"
+
             device_dir = f"output/{self.site}/{timestamp}/{hostname}"
             os.makedirs(device_dir, exist_ok=True)
             
             # Save to individual command file
             command_filename = f"{command}.txt"
             with open(f"{device_dir}/{command_filename}", "w") as f:
-                f.write(f"Command: {command}\n")
+                f.write(header)
                 f.write("=" * 80 + "\n")
                 f.write(output)
                 f.write("\n" + "=" * 80 + "\n")
@@ -88,83 +141,353 @@ class Yapom:
             # Save to consolidated task file
             task_filename = f"{task_name}_output.txt"
             with open(f"{device_dir}/{task_filename}", "a") as f:
-                f.write(f"\nCommand: {command}\n")
+                f.write("\n" + header)
                 f.write("=" * 80 + "\n")
                 f.write(output)
                 f.write("\n" + "=" * 80 + "\n")
             
-            self.output_counter += 1
+            with self.lock:
+                self.output_counter += 1
             
         except Exception as e:
             print(f"Error saving output for {hostname}: {e}")
 
-    def execute_commands(self, nr, commands: list, timestamp: str, task_name: str):
+    def get_cached_outputs(self, nr, command: str) -> dict:
+        """Fresh cached (output, stored_at) of a command, keyed by host name"""
+        if not self.cache or not self.use_cache:
+            return {}
+        return self.cache.get_many(
+            command,
+            [(host.name, host.platform) for host in nr.inventory.hosts.values()]
+        )
+
+    def record_output(self, parsed_rows: dict, host, command: str, output: str, timestamp: str, task_name: str, stored_at: float = None) -> None:
+        """Save a successful command output and queue its parsed records"""
+        self.save_output(
+            hostname=host.name,
+            command=command,
+            output=output,
+            timestamp=timestamp,
+            task_name=task_name,
+            stored_at=stored_at
+        )
+        if self.store:
+            self.collect_records(parsed_rows, host, command, output, timestamp)
+
+    def collect_records(self, parsed_rows: dict, host, command: str, output: str, timestamp: str) -> None:
+        """Parse command output into typed records for the result store"""
+        parser = get_parser(host.platform, command)
+        if not parser:
+            return
+        record_type, parse = parser
+        try:
+            records = parse(output)
+        except Exception as e:
+            print(f"Error parsing {command} for {host.name}: {e}")
+            return
+        for record in records:
+            record.update(
+                run_id=timestamp,
+                site=host.data.get('site', self.site),
+                host=host.name,
+                platform=host.platform,
+                command=command
+            )
+        with self.lock:
+            parsed_rows.setdefault(record_type, []).extend(records)
+
+    def handle_result(self, host, host_data, command: str, timestamp: str, task_name: str, platform: str, parsed_rows: dict, timeout: float = None):
+        """Save one host's command result, returning the output on success"""
+        if host_data.failed:
+            if isinstance(host_data.exception, ScrapliTimeout):
+                print(f"  {host.name} timed out, skipping its remaining commands")
+                with self.lock:
+                    self.failed_hosts.add(host.name)
+                    if platform and timeout:
+                        self.timings.record_timeout(platform, command, timeout)
+            error_msg = f"Error executing command:\n{str(host_data.exception)}"
+            self.save_output(
+                hostname=host.name,
+                command=command,
+                output=error_msg,
+                timestamp=timestamp,
+                task_name=task_name
+            )
+            return None
+
+        duration = elapsed_time(host_data)
+        if platform and duration is not None:
+            with self.lock:
+                self.timings.record(platform, command, duration)
+
+        command_output = host_data.result
+        if isinstance(command_output, dict):
+            command_output = command_output.get(command, "No output")
+        elif isinstance(command_output, list):
+            command_output = command_output[0] if command_output else "No output"
+
+        output = str(command_output)
+        self.record_output(parsed_rows, host, command, output, timestamp, task_name)
+        return output
+
+    def execute_commands(self, nr, commands: list, timestamp: str, task_name: str, platform: str = None):
         """Execute a list of commands on devices"""
         for command in commands:
-            print(f"Running command: {command}")
-            result = nr.run(task=send_commands, commands=[command])
-            
-            for hostname, host_data in result.items():
+            # Hosts that already timed out skip the rest of their command plan
+            active = nr.filter(filter_func=lambda h: h.name not in self.failed_hosts)
+            if len(active.inventory.hosts) == 0:
+                print(f"Skipping command: {command} (no responsive hosts left)")
+                continue
+
+            parsed_rows = {}
+            fresh = []
+
+            cached = self.get_cached_outputs(active, command)
+            for hostname, (output, stored_at) in cached.items():
+                self.record_output(parsed_rows, active.inventory.hosts[hostname], command, output, timestamp, task_name, stored_at)
+            if cached:
+                print(f"Using cached output of {command} for {len(cached)} hosts")
+                active = active.filter(filter_func=lambda h: h.name not in cached)
+
+            default_timeout = configured_timeout(active)
+            timeout = self.timings.timeout_for(platform, command) if platform else None
+            if len(active.inventory.hosts) > 0 and self.low_memory:
+                # Outputs are written from the runner threads and released right away
+                print(f"Running command: {command}" + (f" (timeout {timeout}s)" if timeout else "") + " [low memory]")
+                writer = StreamingResultWriter(
+                    command,
+                    lambda host, host_data: self.handle_result(
+                        host, host_data, command, timestamp, task_name, platform, parsed_rows, timeout or default_timeout
+                    )
+                )
+                # Saving happens inside the runner threads, so it is part of this phase
+                with self.phase(f"execute_commands.{task_name}.{platform}.{command}"):
+                    active.with_processors([writer]).run(task=send_commands, commands=[command], timeout_ops=timeout)
+                failed = sum(1 for record in writer.records if record.failed)
+                print(f"  {len(writer.records) - failed} saved, {failed} failed")
+            elif len(active.inventory.hosts) > 0:
+                print(f"Running command: {command}" + (f" (timeout {timeout}s)" if timeout else ""))
+                with self.phase(f"execute_commands.{task_name}.{platform}.{command}"):
+                    result = active.run(task=send_commands, commands=[command], timeout_ops=timeout)
+                with self.phase(f"save_output.{task_name}.{platform}.{command}"):
+                    for hostname, host_data in result.items():
+                        try:
+                            host = nr.inventory.hosts[hostname]
+                            output = self.handle_result(host, host_data, command, timestamp, task_name, platform, parsed_rows, timeout or default_timeout)
+                            if output is not None:
+                                fresh.append((host.name, host.platform, output))
+                        except Exception as e:
+                            print(f"Error processing result for {hostname}: {str(e)}")
+
+            # Low-memory runs keep no outputs around to cache
+            if self.cache:
+                self.cache.put_many(command, fresh)
+
+            # One bulk insert per record type for the whole command
+            for record_type, rows in parsed_rows.items():
                 try:
-                    if host_data.failed:
-                        error_msg = f"Error executing command:\n{str(host_data.exception)}"
-                        self.save_output(
-                            hostname=str(hostname),
-                            command=command,
-                            output=error_msg,
-                            timestamp=timestamp,
-                            task_name=task_name
-                        )
-                    else:
-                        command_output = host_data.result
-                        if isinstance(command_output, dict):
-                            command_output = command_output.get(command, "No output")
-                        elif isinstance(command_output, list):
-                            command_output = command_output[0] if command_output else "No output"
-                        
-                        self.save_output(
-                            hostname=str(hostname),
-                            command=command,
-                            output=str(command_output),
-                            timestamp=timestamp,
-                            task_name=task_name
-                        )
+                    self.record_counter += self.store.write(record_type, rows)
                 except Exception as e:
-                    print(f"Error processing result for {hostname}: {str(e)}")
+                    print(f"Error storing {record_type} records for {command}: {str(e)}")
+
+    def select_tasks(self):
+        """Tasks selected by the task argument, or None if it is unknown"""
+        if self.task.lower() == 'all':
+            return AVAILABLE_TASKS
+        if self.task not in AVAILABLE_TASKS:
+            print(f"Task '{self.task}' not found. Available tasks: {', '.join(AVAILABLE_TASKS)}")
+            return None
+        return [self.task]
 
     def execute_task(self, nr, timestamp):
         """Execute tasks based on platform and task type"""
         try:
-            if self.task.lower() == 'all':
-                tasks_to_run = AVAILABLE_TASKS
-            else:
-                if self.task not in AVAILABLE_TASKS:
-                    print(f"Task '{self.task}' not found. Available tasks: {', '.join(AVAILABLE_TASKS)}")
-                    return
-                tasks_to_run = [self.task]
+            tasks_to_run = self.select_tasks()
+            if not tasks_to_run:
+                return
+
+            command_tasks = [t for t in tasks_to_run if get_task_type(t) == TaskType.COMMAND]
+            worker_tasks = [t for t in tasks_to_run if get_task_type(t) == TaskType.WORKER]
 
             # Group hosts by platform for efficient command execution
             platforms = set(host.platform for host in nr.inventory.hosts.values())
             
-            for platform in platforms:
+            for platform in (platforms if command_tasks else []):
                 platform_hosts = nr.filter(platform=platform)
                 print(f"\nExecuting commands for {platform} devices:")
                 
-                for task_name in tasks_to_run:
+                for task_name in command_tasks:
                     try:
                         commands = get_commands_for_task(task_name, platform)
                         print(f"\nExecuting task: {task_name}")
-                        self.execute_commands(platform_hosts, commands, timestamp, task_name)
+                        self.execute_commands(platform_hosts, commands, timestamp, task_name, platform)
                     except ValueError as e:
                         print(f"Skipping task {task_name} for platform {platform}: {str(e)}")
                     except Exception as e:
                         print(f"Error executing task {task_name} for platform {platform}: {str(e)}")
 
+            # Workers see the whole fleet so they can correlate devices
+            for task_name in worker_tasks:
+                try:
+                    print(f"\nExecuting worker: {task_name}")
+                    worker = importlib.import_module(f"workers.{get_worker_module(task_name)}")
+                    with self.phase(f"worker.{task_name}"):
+                        worker.run_task(nr, timestamp=timestamp)
+                except Exception as e:
+                    print(f"Error executing worker {task_name}: {str(e)}")
+
         except Exception as e:
             print(f"Error executing tasks: {str(e)}")
 
+    def watch_update(self, previous: dict, host, task_name: str, command: str, state, output: str, timestamp: str, parsed_rows: dict, events_path: str) -> None:
+        """Compare a poll against the last saved state, saving output and emitting events on change"""
+        key = (host.name, task_name, command)
+        event = {"host": host.name, "task": task_name, "command": command}
+
+        if state is None:
+            if previous.get(key, {}) is not None:
+                write_event(events_path, {**event, "event": "unreachable", "error": output})
+                print(f"  ✗ {host.name} {command}: unreachable")
+            previous[key] = None
+            # Drop the session so the next cycle reconnects
+            if "scrapli" in host.connections:
+                try:
+                    host.close_connection("scrapli")
+                except Exception:
+                    pass
+            return
+
+        if key not in previous:
+            event["event"] = "initial"
+        elif previous[key] is None:
+            event["event"] = "recovered"
+        else:
+            changes = diff_state(previous[key], state)
+            if not changes:
+                return
+            event.update(event="changed", changes=changes)
+
+        previous[key] = state
+        write_event(events_path, event)
+        print(f"  Δ {host.name} {command}: {event['event']}")
+        self.record_output(parsed_rows, host, command, output, timestamp, task_name)
+
+    def watch(self, nr, timestamp):
+        """Poll the selected tasks on a schedule, saving output only when state changes"""
+        tasks_to_run = self.select_tasks()
+        if not tasks_to_run:
+            return
+
+        command_tasks = [t for t in tasks_to_run if get_task_type(t) == TaskType.COMMAND]
+        worker_tasks = [t for t in tasks_to_run if get_task_type(t) == TaskType.WORKER]
+        platforms = set(host.platform for host in nr.inventory.hosts.values())
+        jitter = self.watch_jitter if self.watch_jitter is not None else self.watch_interval / 4
+        events_path = f"output/{self.site}/{timestamp}/watch_events.ndjson"
+
+        # Every host runs all of its polls in one task per cycle
+        plan = {}
+        for platform in platforms:
+            for task_name in command_tasks:
+                try:
+                    commands = get_commands_for_task(task_name, platform)
+                except ValueError:
+                    continue
+                skipped = [command for command in commands if command in WATCH_SKIPPED_COMMANDS]
+                if skipped:
+                    print(f"Not watching on {platform} (counters change on every poll): {', '.join(skipped)}")
+                plan.setdefault(platform, []).extend(
+                    (task_name, command) for command in commands if command not in WATCH_SKIPPED_COMMANDS
+                )
+        probes = []
+        for task_name in worker_tasks:
+            module_name, probe_name = get_watch_probe(task_name)
+            probes.append((task_name, probe_name, getattr(importlib.import_module(f"workers.{module_name}"), probe_name)))
+        default_timeouts = {platform: configured_timeout(nr.filter(platform=platform)) for platform in platforms}
+
+        previous = {}
+        cycle = 0
+        print(f"Watching every {self.watch_interval}s (jitter up to {jitter}s), events in {events_path}")
+        try:
+            while True:
+                cycle += 1
+                started = time.monotonic()
+                print(f"\nCycle {cycle} at {datetime.now():%H:%M:%S}")
+                # Every cycle gets a fresh chance at previously failed hosts
+                nr.data.reset_failed_hosts()
+                parsed_rows = {}
+
+                timeouts = {
+                    (platform, command): self.timings.timeout_for(platform, command)
+                    for platform, polls in plan.items()
+                    for _, command in polls
+                }
+                offsets = stagger_offsets(list(nr.inventory.hosts), jitter)
+                start_at = {name: started + offset for name, offset in offsets.items()}
+                result = nr.run(task=poll_host, plan=plan, probes=probes, timeouts=timeouts, start_at=start_at)
+
+                for hostname, host_data in result.items():
+                    host = nr.inventory.hosts[hostname]
+                    if host_data[0].failed:
+                        print(f"Error polling {hostname}: {str(host_data[0].exception)}")
+                        continue
+                    for (task_name, name), poll in host_data[0].result.items():
+                        try:
+                            if poll.failed:
+                                state, output = None, str(poll.exception)
+                                if isinstance(poll.exception, ScrapliTimeout):
+                                    timeout = timeouts.get((host.platform, name)) or default_timeouts[host.platform]
+                                    self.timings.record_timeout(host.platform, name, timeout)
+                            elif task_name in worker_tasks:
+                                table = poll.result
+                                state = neighbor_state(table)
+                                output = json.dumps(table, indent=2)
+                            else:
+                                duration = elapsed_time(poll)
+                                if duration is not None:
+                                    self.timings.record(host.platform, name, duration)
+                                output = poll.result
+                                if isinstance(output, dict):
+                                    output = output.get(name, "No output")
+                                elif isinstance(output, list):
+                                    output = output[0] if output else "No output"
+                                output = str(output)
+                                state = command_state(host.platform, name, output)
+                            self.watch_update(previous, host, task_name, name, state, output, timestamp, parsed_rows, events_path)
+                        except Exception as e:
+                            print(f"Error processing result for {hostname}: {str(e)}")
+
+                for record_type, rows in parsed_rows.items():
+                    try:
+                        self.record_counter += self.store.write(record_type, rows)
+                    except Exception as e:
+                        print(f"Error storing {record_type} records: {str(e)}")
+
+                elapsed = time.monotonic() - started
+                if elapsed > self.watch_interval:
+                    print(f"Warning: cycle {cycle} took {elapsed:.1f}s, longer than the {self.watch_interval}s interval; "
+                          "starting the next cycle now")
+                else:
+                    time.sleep(self.watch_interval - elapsed)
+        except KeyboardInterrupt:
+            print(f"\nStopped watching after {cycle} cycles")
+        finally:
+            nr.close_connections()
+
     def main(self):
         timestamp = "{:%Y-%m-%d_%H-%M}".format(datetime.now())
+        try:
+            self.run(timestamp)
+        finally:
+            # Also covers the exit(1) paths and Ctrl+C
+            if self.profiler:
+                try:
+                    self.profiler.dump(f"output/{self.site or 'ALL'}/{timestamp}/profile")
+                except Exception as e:
+                    print(f"Error saving profiles: {e}")
+
+    def run(self, timestamp):
+        if self.profiler:
+            self.profiler.start("inventory")
         nr = InitNornir(
             config_file=((Path(__file__).parent)/"shared/nornir_data/config.yaml").resolve(), 
             core={"raise_on_error": False}
@@ -198,6 +521,9 @@ class Yapom:
             if self.role and self.role != "ALL":
                 nr = nr.filter(filter_func=lambda h: h.data.get('role', '').upper() == self.role)
 
+        if self.profiler:
+            self.profiler.stop()
+
         # Check if we have matching devices
         if len(nr.inventory.hosts) == 0:
             print(f"\nNo devices found matching the criteria:")
@@ -210,6 +536,10 @@ class Yapom:
                 print(f"Devices: {', '.join(self.devices)}")
             exit(1)
 
+        if self.ssh_persist:
+            reused = enable_connection_reuse(nr, self.ssh_persist)
+            print(f"SSH connection reuse enabled for {reused} devices (persist {self.ssh_persist})")
+
         # Create output directory after confirming we have matching devices
         self.mkdir_now(timestamp=timestamp)
 
@@ -223,17 +553,40 @@ class Yapom:
             print(f"  Platform: {host.platform}")
         print(f"\nNumber of Targeted Hosts: {len(nr.inventory.hosts)}.\n")
 
-        # Verify connectivity
-        nr = self.verify_connectivity(nr)
-        if len(nr.inventory.hosts) == 0:
+        try:
+            self.cache = ResultCache("output/.cache/results.db", max_age=self.max_age)
+        except Exception as e:
+            print(f"Result cache unavailable: {e}")
+
+        # Verify connectivity; watch mode keeps polling unreachable devices
+        # so they can report as recovered
+        inventory = nr
+        with self.phase("verify_connectivity"):
+            nr = self.verify_connectivity(nr)
+        if len(nr.inventory.hosts) == 0 and not (self.task and self.watch_interval):
             print("No devices are accessible. Exiting.")
             exit(1)
 
+        if self.parse_store:
+            self.store = ResultStore(self.parse_store)
+
         # Execute tasks
-        if self.task:
+        if self.task and self.watch_interval:
+            self.watch(inventory, timestamp)
+        elif self.task:
             self.execute_task(nr, timestamp)
 
+        self.timings.save()
+
         print(f"\nThe Number of Saved Files: {self.output_counter}")
+        if self.failed_hosts:
+            print(f"Hosts Skipped After Timeout: {', '.join(sorted(self.failed_hosts))}")
+        if self.cache:
+            print(f"Cached Results Used: {self.cache.hits}")
+            self.cache.close()
+        if self.store:
+            self.store.close()
+            print(f"The Number of Parsed Records: {self.record_counter} ({self.parse_store})")
 
     def mkdir_now(self, timestamp):
         """Create output directory"""
@@ -266,6 +619,24 @@ Examples:
   5. Run task for specific site and role:
      %(prog)s -t basic_info -s NYC -r edge -pu cisco
 
+  6. Parse outputs into the analytics store:
+     %(prog)s -t interface_info -s NYC -pu cisco --parse
+
+  7. Keep SSH sessions alive for follow-up runs:
+     %(prog)s -t basic_info -s NYC -pu cisco --ssh-persist 10m
+
+  8. Accept cached results up to 20 seconds old:
+     %(prog)s -t interface_info -d device1 -pu cisco --max-age 20
+
+  9. Stream large outputs straight to disk:
+     %(prog)s -t basic_info -s ALL -pu cisco --low-memory
+
+  10. Poll OSPF neighbors every 30 seconds, logging changes:
+     %(prog)s -t analyze_ospf -s NYC -pu cisco --watch 30
+
+  11. Profile each phase of the run:
+     %(prog)s -t routing_info -s NYC -pu cisco --profile
+
 Available Tasks:
   {', '.join(AVAILABLE_TASKS)}
   all - Run all tasks
@@ -302,6 +673,43 @@ Supported Platforms:
     parser.add_argument('-p', '--platform', 
                        choices=list(VENDOR_COMMANDS.keys()), 
                        help='Device platform filter')
+
+    parser.add_argument('--parse',
+                       nargs='?',
+                       const='output/yapom.db',
+                       metavar='DB',
+                       help='Parse command output into a SQLite store (default: output/yapom.db)')
+
+    parser.add_argument('--ssh-persist',
+                       metavar='TIME',
+                       help='Reuse OpenSSH ControlMaster connections kept alive for TIME (e.g. 600, 10m)')
+
+    parser.add_argument('--max-age',
+                       type=float,
+                       metavar='SECONDS',
+                       help='Only use cached results younger than SECONDS')
+
+    parser.add_argument('--no-cache',
+                       action='store_true',
+                       help='Always query devices (fresh results still refresh the cache)')
+
+    parser.add_argument('--low-memory',
+                       action='store_true',
+                       help='Write each output to disk as it arrives and release it (not cached)')
+
+    parser.add_argument('--watch',
+                       type=float,
+                       metavar='INTERVAL',
+                       help='Poll the task every INTERVAL seconds, saving output only on state changes')
+
+    parser.add_argument('--jitter',
+                       type=float,
+                       metavar='SECONDS',
+                       help='Max random per-device delay in watch mode (default: INTERVAL/4)')
+
+    parser.add_argument('--profile',
+                       action='store_true',
+                       help='Save per-phase cProfile stats and flame graph stacks in the output directory')
     
     args = parser.parse_args()
 
@@ -315,6 +723,15 @@ Supported Platforms:
     if args.role and not args.site:
         parser.error("-r (role) requires -s (site)")
 
+    if args.watch is not None and args.watch <= 0:
+        parser.error("--watch interval must be positive")
+
+    if args.jitter is not None and args.watch is None:
+        parser.error("--jitter requires --watch")
+
+    if args.jitter is not None and not 0 <= args.jitter < args.watch:
+        parser.error("--jitter must be at least 0 and less than the --watch interval")
+
     # Convert to upper case where needed
     if args.site:
         args.site = args.site.upper()
@@ -327,6 +744,14 @@ Supported Platforms:
         devices=args.devices,
         platform=args.platform,
         login_user=args.login_user,
-        task=args.task
+        task=args.task,
+        parse_store=args.parse,
+        ssh_persist=args.ssh_persist,
+        use_cache=not args.no_cache,
+        max_age=args.max_age,
+        low_memory=args.low_memory,
+        watch_interval=args.watch,
+        watch_jitter=args.jitter,
+        profile=args.profile
     )
     yapom_tasks.main()
\ No newline at end of file
@@ -0,0 +1,93 @@
+import sqlite3
+import time
+import os
+from shared.services.mod import get_cache_ttl
+
+class ResultCache:
+    """Size-bounded LRU cache of command output shared across YAPOM runs"""
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024, max_age: float = None):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "host TEXT, platform TEXT, command TEXT, output TEXT, "
+                "size INTEGER, stored_at REAL, last_used REAL, "
+                "PRIMARY KEY (host, platform, command))"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_results_lru ON results (last_used)")
+
+    def max_age_for(self, command: str) -> float:
+        """Command TTL, capped by the caller's --max-age"""
+        ttl = get_cache_ttl(command)
+        return ttl if self.max_age is None else min(ttl, self.max_age)
+
+    def get_many(self, command: str, hosts: list) -> dict:
+        """Fresh cached output for (host, platform) pairs: host -> (output, stored_at)
+
+        The LRU touches for all hits are committed in one transaction.
+        """
+        now = time.time()
+        max_age = self.max_age_for(command)
+        found = {}
+        for host, platform in hosts:
+            row = self.conn.execute(
+                "SELECT output, stored_at FROM results WHERE host = ? AND platform = ? AND command = ?",
+                (host, platform, command)
+            ).fetchone()
+            if row is not None and now - row[1] <= max_age:
+                found[host] = (platform, row[0], row[1])
+        if found:
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE results SET last_used = ? WHERE host = ? AND platform = ? AND command = ?",
+                    [(now, host, platform, command) for host, (platform, _, _) in found.items()]
+                )
+        self.hits += len(found)
+        return {host: (output, stored_at) for host, (_, output, stored_at) in found.items()}
+
+    def put_many(self, command: str, outputs: list) -> None:
+        """Store (host, platform, output) entries for one command and evict down to max_bytes"""
+        if not outputs:
+            return
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (host, platform, command, output, len(output), now, now)
+                    for host, platform, output in outputs
+                ]
+            )
+        self.evict()
+
+    def evict(self) -> None:
+        """Drop least recently used entries until the cache fits max_bytes"""
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self.conn.execute(
+            "SELECT host, platform, command, size FROM results ORDER BY last_used"
+        ).fetchall()
+        stale = []
+        for host, platform, command, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((host, platform, command))
+            total -= size
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM results WHERE host = ? AND platform = ? AND command = ?",
+                stale
+            )
+
+    def close(self):
+        self.conn.close()
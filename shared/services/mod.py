@@ -94,6 +94,56 @@ VENDOR_COMMANDS = {
     }
 }
 
+# Filtered command variants for callers that only need a few fields.
+# On-device pipes (include/begin/count/json, Junos match/count) keep large
+# tables such as full BGP/OSPF route lists off the management link.
+FILTERED_COMMANDS = {
+    "ios": {
+        "bgp_summary": "show ip bgp summary | begin Neighbor",
+        "bgp_neighbor": "show ip bgp neighbor {neighbor_ip}",
+        "bgp_advertised_routes": "show ip bgp neighbor {neighbor_ip} advertised-routes | include Total",
+        "bgp_received_routes": "show ip bgp neighbor {neighbor_ip} received-routes | include Total",
+        "bgp_routes": "show ip route bgp | count ^B",
+        "ospf_neighbors": "show ip ospf neighbor",
+        "ospf_interface": "show ip ospf interface {interface}",
+        "interface": "show interfaces {interface} | include line protocol|Internet address|MTU|errors|drops",
+        "ospf_routes": "show ip route ospf | count ^O"
+    },
+    "nxos": {
+        "bgp_summary": "show ip bgp summary | begin Neighbor",
+        "bgp_neighbor": "show ip bgp neighbors {neighbor_ip}",
+        "bgp_advertised_routes": "show ip bgp neighbors {neighbor_ip} advertised-routes | count",
+        "bgp_received_routes": "show ip bgp neighbors {neighbor_ip} received-routes | count",
+        "bgp_routes": "show ip route summary | json",
+        "ospf_neighbors": "show ip ospf neighbors",
+        "ospf_interface": "show ip ospf interface {interface}",
+        "interface": "show interface {interface} | include \"line protocol|Internet Address|MTU|errors|drops\"",
+        "ospf_routes": "show ip route summary | json"
+    },
+    "junos": {
+        "bgp_summary": "show bgp summary",
+        "bgp_neighbor": "show bgp neighbor {neighbor_ip}",
+        "bgp_advertised_routes": "show route advertising-protocol bgp {neighbor_ip} | count",
+        "bgp_received_routes": "show route receive-protocol bgp {neighbor_ip} | count",
+        "bgp_routes": "show route protocol bgp | count",
+        "ospf_neighbors": "show ospf neighbor",
+        "ospf_interface": "show ospf interface {interface} detail",
+        "interface": "show interfaces {interface} | match \"Physical|Logical|MTU|errors|drops\"",
+        "ospf_routes": "show route protocol ospf | count"
+    },
+    "eos": {
+        "bgp_summary": "show ip bgp summary | begin Neighbor",
+        "bgp_neighbor": "show ip bgp neighbors {neighbor_ip}",
+        "bgp_advertised_routes": "show ip bgp neighbors {neighbor_ip} advertised-routes | include Total",
+        "bgp_received_routes": "show ip bgp neighbors {neighbor_ip} received-routes | include Total",
+        "bgp_routes": "show ip route summary | json",
+        "ospf_neighbors": "show ip ospf neighbor",
+        "ospf_interface": "show ip ospf interface {interface}",
+        "interface": "show interfaces {interface} | include line protocol|Internet address|MTU|errors|drops",
+        "ospf_routes": "show ip route summary | json"
+    }
+}
+
 # Define both command-based and worker-based tasks
 TASK_DEFINITIONS = {
     # Command-based tasks
@@ -117,18 +167,47 @@ TASK_DEFINITIONS = {
     "tshoot_bgp": {
         "type": TaskType.WORKER,
         "description": "BGP troubleshooting workflow",
-        "worker": "bgp_analysis"
+        "worker": "bgp_analysis",
+        "watch_probe": "analyze_bgp_summary"
     },
     "analyze_ospf": {
         "type": TaskType.WORKER,
         "description": "OSPF analysis and verification",
-        "worker": "ospf_analysis"
+        "worker": "ospf_analysis",
+        "watch_probe": "analyze_ospf_neighbors"
     }
 }
 
 # List of available tasks
 AVAILABLE_TASKS = list(TASK_DEFINITIONS.keys())
 
+# Result cache lifetime in seconds, by command prefix (first match wins)
+COMMAND_CACHE_TTLS = [
+    ("show logging", 10),
+    ("show log", 10),
+    ("show processes", 10),
+    ("show system processes", 10),
+    ("show system resources", 15),
+    ("show memory", 30),
+    ("show system memory", 30),
+    ("show ip ospf", 30),
+    ("show ospf", 30),
+    ("show ip bgp", 30),
+    ("show interface", 30),
+    ("show ip interface", 30),
+    ("show ip route", 60),
+    ("show route", 60),
+    ("show ip protocols", 300),
+    ("show protocols", 300),
+    ("show running-config", 300),
+    ("show configuration", 300),
+    ("show inventory", 3600),
+    ("show chassis hardware", 3600),
+    ("show version", 3600)
+]
+
+DEFAULT_CACHE_TTL = 30
+
 def get_task_type(task_name: str) -> TaskType:
     """Get the type of task (command or worker)"""
     if task_name not in TASK_DEFINITIONS:
@@ -142,6 +221,11 @@ def get_worker_module(task_name: str) -> str:
         raise ValueError(f"No worker defined for task {task_name}")
     return TASK_DEFINITIONS[task_name]["worker"]
 
+def get_watch_probe(task_name: str) -> tuple:
+    """Get the worker module and neighbor-table task polled in watch mode"""
+    module = get_worker_module(task_name)
+    return module, TASK_DEFINITIONS[task_name]["watch_probe"]
+
 def get_commands_for_task(task_name: str, platform: str) -> list:
     """Get commands for a command-based task and platform"""
     if get_task_type(task_name) != TaskType.COMMAND:
@@ -154,4 +238,19 @@ def get_commands_for_task(task_name: str, platform: str) -> list:
     if task_name not in VENDOR_COMMANDS[platform]:
         raise ValueError(f"Task {task_name} not found for platform {platform}")
     
-    return VENDOR_COMMANDS[platform][task_name]
\ No newline at end of file
+    return VENDOR_COMMANDS[platform][task_name]
+
+def get_filtered_command(platform: str, name: str, **params) -> str:
+    """Get a filtered command variant for a platform, defaulting to IOS syntax"""
+    platform = (platform or "ios").lower()
+    commands = FILTERED_COMMANDS.get(platform, FILTERED_COMMANDS["ios"])
+    if name not in commands:
+        raise ValueError(f"Filtered command {name} not found for platform {platform}")
+    return commands[name].format(**params)
+
+def get_cache_ttl(command: str) -> int:
+    """Get the result cache lifetime for a command"""
+    for prefix, ttl in COMMAND_CACHE_TTLS:
+        if command.startswith(prefix):
+            return ttl
+    return DEFAULT_CACHE_TTL
@@ -0,0 +1,156 @@
+# shared/services/neighbors.py
+# BGP and OSPF neighbor tables, shared by the analysis workers and watch mode
+
+import re
+from shared.services.mod import get_filtered_command
+
+# Pre-established BGP states, least to most progressed
+BGP_STATES = ["Idle", "Connect", "Active", "OpenSent", "OpenConfirm"]
+
+def bgp_established(state):
+    """Whether a summary state column means the session is up"""
+    return state.isdigit() or state.startswith("Establ")
+
+def bgp_state_rank(state):
+    """Rank a BGP state; established sessions report a prefix count"""
+    if bgp_established(state):
+        return len(BGP_STATES)
+    return BGP_STATES.index(state) if state in BGP_STATES else 0
+
+def parse_bgp_summary(output):
+    """Parse IOS-style BGP summary output (State/PfxRcd as the last column)"""
+    neighbors = {}
+    for line in output.splitlines():
+        if re.match(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}', line):
+            fields = line.split()
+            neighbor_ip = fields[0]
+            state = fields[-1]
+            # Established sessions show the received prefix count as the state
+            prefixes = state if state.isdigit() else "N/A"
+            
+            neighbors[neighbor_ip] = {
+                "state": state,
+                "prefixes": prefixes,
+                "needs_investigation": not bgp_established(state)
+            }
+    
+    return neighbors
+
+def parse_junos_bgp_summary(output):
+    """Parse Junos 'show bgp summary' output
+
+    Established peers end in Active/Received/Accepted/Damped counts, or in
+    "Establ" with the counts on indented per-RIB lines below. Any other
+    final column is the session state.
+    """
+    neighbors = {}
+    current = None
+    for line in output.splitlines():
+        if re.match(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\s', line):
+            fields = line.split()
+            counts = [f for f in fields[1:] if re.match(r'^\d+/\d+/\d+/\d+$', f)]
+            if counts:
+                state, prefixes = "Establ", counts[0].split("/")[1]
+            else:
+                state, prefixes = fields[-1], "N/A"
+            current = fields[0]
+            neighbors[current] = {
+                "state": state,
+                "prefixes": prefixes,
+                "needs_investigation": not bgp_established(state)
+            }
+            continue
+        
+        # "  inet.0: 1/2/2/0" under an "Establ" peer
+        match = re.match(r'^\s+\S+:\s+\d+/(\d+)/\d+/\d+', line)
+        if match and current and neighbors[current]["prefixes"] == "N/A":
+            neighbors[current]["prefixes"] = match.group(1)
+    
+    return neighbors
+
+BGP_SUMMARY_PARSERS = {
+    "junos": parse_junos_bgp_summary
+}
+
+# OSPF adjacency states, least to most progressed
+OSPF_STATES = ["DOWN", "ATTEMPT", "INIT", "2WAY", "EXSTART", "EXCHANGE", "LOADING", "FULL"]
+
+def ospf_state_rank(state):
+    """Rank an OSPF neighbor state such as FULL or FULL/DR"""
+    state = state.split("/")[0].upper()
+    return OSPF_STATES.index(state) if state in OSPF_STATES else 0
+
+def parse_ospf_neighbors(output):
+    """Parse IOS-style OSPF neighbor output
+
+    Neighbors are keyed by address so parallel adjacencies to the same
+    router stay separate.
+    """
+    neighbors = {}
+    for line in output.splitlines():
+        # Neighbor ID, Pri, State/Role, Dead Time, Address, Interface
+        match = re.search(r'(\d+\.\d+\.\d+\.\d+)\s+\d+\s+([\w-]+)/\s*\S*\s+\S+\s+(\d+\.\d+\.\d+\.\d+)\s+(\S+)', line)
+        if match:
+            neighbor_id = match.group(1)
+            state = match.group(2)
+            neighbor_ip = match.group(3)
+            interface = match.group(4)
+            
+            neighbors[neighbor_ip] = {
+                "neighbor_id": neighbor_id,
+                "state": state,
+                "interface": interface,
+                "needs_investigation": state != "FULL"
+            }
+    
+    return neighbors
+
+def parse_junos_ospf_neighbors(output):
+    """Parse Junos 'show ospf neighbor' output"""
+    neighbors = {}
+    for line in output.splitlines():
+        # Address, Interface, State, ID, Pri, Dead
+        match = re.match(r'^(\d+\.\d+\.\d+\.\d+)\s+(\S+)\s+(\w+)\s+(\d+\.\d+\.\d+\.\d+)\s+\d+', line)
+        if match:
+            neighbor_ip, interface, state, neighbor_id = match.groups()
+            state = state.upper()
+            
+            neighbors[neighbor_ip] = {
+                "neighbor_id": neighbor_id,
+                "state": state,
+                "interface": interface,
+                "needs_investigation": state != "FULL"
+            }
+    
+    return neighbors
+
+def parse_eos_ospf_neighbors(output):
+    """Parse EOS 'show ip ospf neighbor' output"""
+    neighbors = {}
+    for line in output.splitlines():
+        # Neighbor ID, Instance, VRF, Pri, State, Dead Time, Address, Interface
+        match = re.match(r'^(\d+\.\d+\.\d+\.\d+)\s+\d+\s+\S+\s+\d+\s+([\w-]+)(?:/\S*)?\s+\S+\s+(\d+\.\d+\.\d+\.\d+)\s+(\S+)', line)
+        if match:
+            neighbor_id, state, neighbor_ip, interface = match.groups()
+            
+            neighbors[neighbor_ip] = {
+                "neighbor_id": neighbor_id,
+                "state": state,
+                "interface": interface,
+                "needs_investigation": state != "FULL"
+            }
+    
+    return neighbors
+
+OSPF_NEIGHBOR_PARSERS = {
+    "junos": parse_junos_ospf_neighbors,
+    "eos": parse_eos_ospf_neighbors
+}
+
+def get_neighbor_parser(platform, command):
+    """Neighbor table parser for a BGP summary or OSPF neighbor command, if any"""
+    if command == get_filtered_command(platform, "bgp_summary"):
+        return BGP_SUMMARY_PARSERS.get(platform, parse_bgp_summary)
+    if command == get_filtered_command(platform, "ospf_neighbors"):
+        return OSPF_NEIGHBOR_PARSERS.get(platform, parse_ospf_neighbors)
+    return None
@@ -0,0 +1,344 @@
+import re
+
+IPV4 = r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}'
+
+def parse_ip_interface_brief(output: str) -> list:
+    """Parse IOS 'show ip interface brief'"""
+    records = []
+    for line in output.splitlines():
+        fields = line.split()
+        if len(fields) >= 6 and fields[2] in ("YES", "NO"):
+            records.append({
+                "name": fields[0],
+                "ip_address": None if fields[1] == "unassigned" else fields[1],
+                "status": " ".join(fields[4:-1]),
+                "protocol": fields[-1]
+            })
+    return records
+
+def parse_eos_ip_interface_brief(output: str) -> list:
+    """Parse EOS 'show ip interface brief'"""
+    records = []
+    for line in output.splitlines():
+        match = re.match(rf'^(\S+)\s+({IPV4}/\d+|unassigned)\s+(.+?)\s+(\S+)\s+\d+\s*$', line)
+        if match:
+            records.append({
+                "name": match.group(1),
+                "ip_address": None if match.group(2) == "unassigned" else match.group(2),
+                "status": match.group(3),
+                "protocol": match.group(4)
+            })
+    return records
+
+def parse_nxos_ip_interface_brief(output: str) -> list:
+    """Parse NX-OS 'show ip interface brief'"""
+    records = []
+    for line in output.splitlines():
+        match = re.match(rf'^(\S+)\s+({IPV4})\s+protocol-(\w+)/link-(\w+)/admin-(\w+)', line)
+        if match:
+            records.append({
+                "name": match.group(1),
+                "ip_address": match.group(2),
+                "status": match.group(5),
+                "protocol": match.group(3)
+            })
+    return records
+
+def parse_junos_interfaces_terse(output: str) -> list:
+    """Parse Junos 'show interfaces terse'"""
+    records = []
+    for line in output.splitlines():
+        fields = line.split()
+        if len(fields) < 3 or fields[1] not in ("up", "down"):
+            continue
+        ip_address = None
+        if "inet" in fields and fields.index("inet") + 1 < len(fields):
+            ip_address = fields[fields.index("inet") + 1]
+        records.append({
+            "name": fields[0],
+            "ip_address": ip_address,
+            "status": fields[1],
+            "protocol": fields[2]
+        })
+    return records
+
+def route_path(text: str) -> tuple:
+    """Next hop and outgoing interface of an IOS/EOS route path"""
+    next_hop = re.search(rf'via ({IPV4})', text)
+    interface = re.search(r'(?:directly connected|via \S+),.*?([A-Za-z][\w/.:-]*\d)\s*$', text)
+    return (
+        next_hop.group(1) if next_hop else None,
+        interface.group(1) if interface else None
+    )
+
+def parse_ip_route(output: str) -> list:
+    """Parse IOS/EOS 'show ip route'
+
+    Routes under an "is subnetted" header carry no mask and take it from the
+    header. Indented path lines (ECMP, or a path wrapped onto the next line)
+    belong to the last prefix.
+    """
+    records = []
+    subnet_mask = None
+    current = None
+    for line in output.splitlines():
+        header = re.match(rf'^\s+{IPV4}/(\d+) is (variably )?subnetted', line)
+        if header:
+            subnet_mask = None if header.group(2) else header.group(1)
+            current = None
+            continue
+
+        # Codes such as "O IA", or "O*E2" on a candidate default
+        match = re.match(rf'^([A-Za-z]+)\*?(?: ?([A-Z0-9]{{1,2}}))?\s+({IPV4})(/\d+)?(?:\s+(.*))?$', line)
+        if match:
+            mask = match.group(4) or (f"/{subnet_mask}" if subnet_mask else None)
+            if mask is None:
+                current = None
+                continue
+            next_hop, interface = route_path(match.group(5) or "")
+            current = {
+                "protocol": " ".join(filter(None, match.group(1, 2))),
+                "prefix": match.group(3) + mask,
+                "next_hop": next_hop,
+                "interface": interface
+            }
+            records.append(current)
+            continue
+
+        path = re.match(r'^\s+(?:\[[^\]]+\]\s+)?(via .*|is directly connected.*)$', line)
+        if path and current:
+            next_hop, interface = route_path(path.group(1))
+            if current["next_hop"] is None and current["interface"] is None:
+                # Path wrapped onto its own line
+                current.update(next_hop=next_hop, interface=interface)
+            else:
+                records.append({**current, "next_hop": next_hop, "interface": interface})
+            continue
+
+        if not line.startswith(" "):
+            subnet_mask = None
+            current = None
+    return records
+
+def parse_nxos_ip_route(output: str) -> list:
+    """Parse NX-OS 'show ip route'"""
+    records = []
+    prefix = None
+    for line in output.splitlines():
+        prefix_match = re.match(rf'^({IPV4}/\d+), ubest', line)
+        if prefix_match:
+            prefix = prefix_match.group(1)
+            continue
+        path_match = re.match(rf'^\s+\*via ({IPV4})(?:, (\S+?))?, \[[^\]]+\], [^,]+, ([\w-]+)', line)
+        if prefix and path_match:
+            records.append({
+                "protocol": path_match.group(3).split("-")[0],
+                "prefix": prefix,
+                "next_hop": path_match.group(1),
+                "interface": path_match.group(2)
+            })
+    return records
+
+def parse_junos_route(output: str) -> list:
+    """Parse Junos 'show route'"""
+    records = []
+    prefix = None
+    protocol = None
+    for line in output.splitlines():
+        prefix_match = re.match(rf'^({IPV4}/\d+)\s+[*+-]?\[(\w+)/\d+\]', line)
+        if prefix_match:
+            prefix, protocol = prefix_match.groups()
+            continue
+        path_match = re.match(rf'^\s+>?\s*(?:to ({IPV4}) )?via (\S+)', line)
+        if prefix and path_match:
+            records.append({
+                "protocol": protocol,
+                "prefix": prefix,
+                "next_hop": path_match.group(1),
+                "interface": path_match.group(2)
+            })
+    return records
+
+def parse_ios_processes_cpu(output: str) -> list:
+    """Parse IOS 'show processes cpu' header"""
+    match = re.search(r'five seconds: (\d+)%.*one minute: (\d+)%.*five minutes: (\d+)%', output)
+    if not match:
+        return []
+    return [
+        {"metric": "cpu_5s_percent", "value": float(match.group(1))},
+        {"metric": "cpu_1m_percent", "value": float(match.group(2))},
+        {"metric": "cpu_5m_percent", "value": float(match.group(3))}
+    ]
+
+def parse_ios_memory_statistics(output: str) -> list:
+    """Parse IOS 'show memory statistics' processor pool"""
+    match = re.search(r'^\s*Processor\s+\S+\s+(\d+)\s+(\d+)\s+(\d+)', output, re.MULTILINE)
+    if not match:
+        return []
+    return [
+        {"metric": "memory_total_bytes", "value": float(match.group(1))},
+        {"metric": "memory_used_bytes", "value": float(match.group(2))},
+        {"metric": "memory_free_bytes", "value": float(match.group(3))}
+    ]
+
+def parse_nxos_system_resources(output: str) -> list:
+    """Parse NX-OS 'show system resources'"""
+    records = []
+    cpu = re.search(r'CPU states\s*:\s*[\d.]+% user,\s*[\d.]+% kernel,\s*([\d.]+)% idle', output)
+    if cpu:
+        records.append({"metric": "cpu_percent", "value": round(100 - float(cpu.group(1)), 2)})
+    memory = re.search(r'Memory usage:\s*(\d+)K total,\s*(\d+)K used,\s*(\d+)K free', output)
+    if memory:
+        records.extend([
+            {"metric": "memory_total_bytes", "value": float(memory.group(1)) * 1024},
+            {"metric": "memory_used_bytes", "value": float(memory.group(2)) * 1024},
+            {"metric": "memory_free_bytes", "value": float(memory.group(3)) * 1024}
+        ])
+    return records
+
+def parse_eos_processes_top(output: str) -> list:
+    """Parse EOS 'show processes top' summary"""
+    records = []
+    cpu = re.search(r'%Cpu\(s\):.*?([\d.]+) id', output)
+    if cpu:
+        records.append({"metric": "cpu_percent", "value": round(100 - float(cpu.group(1)), 2)})
+    memory = re.search(r'KiB Mem\s*:\s*(\d+) total,\s*(\d+) free,\s*(\d+) used', output)
+    if memory:
+        records.extend([
+            {"metric": "memory_total_bytes", "value": float(memory.group(1)) * 1024},
+            {"metric": "memory_free_bytes", "value": float(memory.group(2)) * 1024},
+            {"metric": "memory_used_bytes", "value": float(memory.group(3)) * 1024}
+        ])
+    return records
+
+def parse_show_inventory(output: str) -> list:
+    """Parse IOS/NX-OS 'show inventory'"""
+    records = []
+    pattern = re.compile(
+        r'NAME:\s*"([^"]*)",\s*DESCR:\s*"([^"]*)"\s*\n\s*PID:\s*(\S*)\s*,.*?SN:\s*(\S*)'
+    )
+    for match in pattern.finditer(output):
+        records.append({
+            "name": match.group(1),
+            "description": match.group(2),
+            "pid": match.group(3) or None,
+            "serial": match.group(4) or None
+        })
+    return records
+
+def parse_junos_processes_extensive(output: str) -> list:
+    """Parse the top-style header of Junos 'show system processes extensive'"""
+    records = []
+    cpu = re.search(r'^CPU:.*?([\d.]+)% idle', output, re.MULTILINE)
+    if cpu:
+        records.append({"metric": "cpu_percent", "value": round(100 - float(cpu.group(1)), 2)})
+    memory = re.search(r'^Mem:(.*)$', output, re.MULTILINE)
+    if memory:
+        units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+        sizes = {
+            name: float(value) * units[unit]
+            for value, unit, name in re.findall(r'([\d.]+)([KMG]) (\w+)', memory.group(1))
+        }
+        if sizes:
+            # Buf is a subset of Wired
+            total = sum(size for name, size in sizes.items() if name != "Buf")
+            free = sizes.get("Free", 0.0)
+            records.extend([
+                {"metric": "memory_total_bytes", "value": total},
+                {"metric": "memory_used_bytes", "value": total - free},
+                {"metric": "memory_free_bytes", "value": free}
+            ])
+    return records
+
+def fixed_width_rows(lines: list, header: str, columns: list) -> list:
+    """Split fixed-width table rows using the column offsets of a header line"""
+    offsets = [header.index(column) for column in columns]
+    rows = []
+    for line in lines:
+        if not line.strip():
+            break
+        cells = [
+            line[start:end].strip()
+            for start, end in zip([0] + offsets, offsets + [None])
+        ]
+        rows.append(cells)
+    return rows
+
+def parse_junos_chassis_hardware(output: str) -> list:
+    """Parse Junos 'show chassis hardware'"""
+    lines = output.splitlines()
+    for index, line in enumerate(lines):
+        if line.startswith("Item") and "Serial number" in line:
+            columns = ["Version", "Part number", "Serial number", "Description"]
+            return [
+                {
+                    "name": name,
+                    "description": description or None,
+                    "pid": part or None,
+                    "serial": serial or None
+                }
+                for name, _, part, serial, description in fixed_width_rows(lines[index + 1:], line, columns)
+                if name
+            ]
+    return []
+
+def parse_eos_show_inventory(output: str) -> list:
+    """Parse the chassis and transceiver tables of EOS 'show inventory'"""
+    records = []
+    lines = output.splitlines()
+    model = None
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith("Model") and "Description" in stripped:
+            rows = fixed_width_rows(lines[index + 2:], line, ["Description"])
+            if rows:
+                model = {"name": "Chassis", "pid": rows[0][0], "description": rows[0][1], "serial": None}
+                records.append(model)
+        elif stripped.startswith("HW Version") and "Serial Number" in stripped and model:
+            rows = fixed_width_rows(lines[index + 2:], line, ["Serial Number", "Mfg Date"])
+            if rows:
+                model["serial"] = rows[0][1] or None
+        elif stripped.startswith("Port") and "Serial Number" in stripped and "Model" in stripped:
+            rows = fixed_width_rows(lines[index + 2:], line, ["Manufacturer", "Model", "Serial Number", "Rev"])
+            for port, manufacturer, pid, serial, _ in rows:
+                if pid:
+                    records.append({
+                        "name": f"Port {port}",
+                        "description": manufacturer or None,
+                        "pid": pid,
+                        "serial": serial or None
+                    })
+    return records
+
+# Command output -> (record type, parser) per platform
+COMMAND_PARSERS = {
+    "ios": {
+        "show ip interface brief": ("interfaces", parse_ip_interface_brief),
+        "show ip route": ("routes", parse_ip_route),
+        "show processes cpu": ("health", parse_ios_processes_cpu),
+        "show memory statistics": ("health", parse_ios_memory_statistics),
+        "show inventory": ("inventory", parse_show_inventory)
+    },
+    "nxos": {
+        "show ip interface brief": ("interfaces", parse_nxos_ip_interface_brief),
+        "show ip route": ("routes", parse_nxos_ip_route),
+        "show system resources": ("health", parse_nxos_system_resources),
+        "show inventory": ("inventory", parse_show_inventory)
+    },
+    "junos": {
+        "show interfaces terse": ("interfaces", parse_junos_interfaces_terse),
+        "show route": ("routes", parse_junos_route),
+        "show system processes extensive": ("health", parse_junos_processes_extensive),
+        "show chassis hardware": ("inventory", parse_junos_chassis_hardware)
+    },
+    "eos": {
+        "show ip interface brief": ("interfaces", parse_eos_ip_interface_brief),
+        "show ip route": ("routes", parse_ip_route),
+        "show processes top": ("health", parse_eos_processes_top),
+        "show inventory": ("inventory", parse_eos_show_inventory)
+    }
+}
+
+def get_parser(platform: str, command: str):
+    """Get the (record type, parser) for a platform command, or None"""
+    return COMMAND_PARSERS.get(platform.lower(), {}).get(command)
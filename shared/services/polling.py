@@ -0,0 +1,49 @@
+import random
+import time
+from nornir.core.exceptions import NornirSubTaskError
+from nornir_scrapli.tasks import send_commands
+from scrapli.exceptions import ScrapliTimeout
+
+def stagger_offsets(hosts: list, max_delay: float) -> dict:
+    """Random start offsets that spread hosts over max_delay seconds
+
+    Each host gets a random point within its own equal slice of the window,
+    in inventory order. The runner also takes hosts in inventory order, so a
+    thread waiting for its host's start never holds back a host due earlier.
+    """
+    if max_delay <= 0 or not hosts:
+        return {}
+    width = max_delay / len(hosts)
+    return {
+        host: (index + random.random()) * width
+        for index, host in enumerate(hosts)
+    }
+
+def poll_host(task, plan: dict, probes: list, timeouts: dict, start_at: dict):
+    """Run one watch cycle on a host: a single staggered start, then every poll
+
+    plan maps platform -> [(task_name, command)], probes is a list of
+    (task_name, probe_name, probe) and start_at maps host name -> the
+    monotonic time its polls may begin. Returns {(task_name, name): Result}.
+    A timeout skips the host's remaining polls for the cycle.
+    """
+    delay = start_at.get(task.host.name, 0) - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+
+    platform = task.host.platform
+    polls = [
+        ((task_name, command), send_commands, {"commands": [command], "timeout_ops": timeouts.get((platform, command))})
+        for task_name, command in plan.get(platform, [])
+    ] + [((task_name, probe_name), probe, {}) for task_name, probe_name, probe in probes]
+
+    results = {}
+    for key, poll, kwargs in polls:
+        try:
+            task.run(task=poll, name=key[1], **kwargs)
+        except NornirSubTaskError:
+            pass
+        results[key] = task.results[-1]
+        if isinstance(results[key].exception, ScrapliTimeout):
+            break
+    return results
@@ -0,0 +1,123 @@
+from contextlib import contextmanager
+import cProfile
+import pstats
+import threading
+import sys
+import os
+import re
+
+class PhaseProfiler:
+    """cProfile per run phase, including the Nornir runner threads
+
+    Threads started while a phase is active get their own profiler through
+    threading.setprofile. On interpreters where cProfile is already
+    interpreter-wide (sys.monitoring), the main profiler sees every thread and
+    the per-thread hook steps aside.
+    """
+
+    def __init__(self):
+        self.phases = []
+        self.current = None
+        self.lock = threading.Lock()
+
+    def start(self, name: str) -> None:
+        if self.current:
+            self.stop()
+        profilers = [cProfile.Profile()]
+        lock = self.lock
+
+        def thread_hook(frame, event, arg):
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                sys.setprofile(None)
+                return
+            with lock:
+                profilers.append(profiler)
+
+        self.current = (name, profilers)
+        threading.setprofile(thread_hook)
+        profilers[0].enable()
+
+    def stop(self) -> None:
+        if not self.current:
+            return
+        name, profilers = self.current
+        profilers[0].disable()
+        threading.setprofile(None)
+        self.current = None
+
+        collected = []
+        for profiler in profilers:
+            profiler.create_stats()
+            if profiler.stats:
+                collected.append(profiler)
+        if collected:
+            self.phases.append((name, pstats.Stats(*collected)))
+
+    @contextmanager
+    def phase(self, name: str):
+        self.start(name)
+        try:
+            yield
+        finally:
+            self.stop()
+
+    def dump(self, output_dir: str) -> None:
+        """Write <n>_<phase>.prof stats and .collapsed flame graph stacks"""
+        self.stop()
+        os.makedirs(output_dir, exist_ok=True)
+        for index, (name, stats) in enumerate(self.phases, start=1):
+            filename = f"{index:03d}_" + re.sub(r'[^\w.-]+', '_', name)
+            stats.dump_stats(f"{output_dir}/{filename}.prof")
+            with open(f"{output_dir}/{filename}.collapsed", "w") as f:
+                for stack, micros in sorted(collapsed_stacks(stats).items()):
+                    f.write(f"{stack} {micros}\n")
+        print(f"Profiles for {len(self.phases)} phases saved in: {output_dir}")
+
+def function_label(func) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{os.path.basename(filename)}:{name}:{line}"
+
+def collapsed_stacks(stats, max_depth: int = 64, min_seconds: float = 1e-6) -> dict:
+    """Collapsed stacks (flamegraph.pl format) in microseconds
+
+    cProfile only records caller/callee edges, so paths are rebuilt from the
+    call graph and a shared callee's time is split across its callers in
+    proportion to the time each edge accounts for.
+    """
+    callees = {}
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge[3]
+
+    roots = [
+        func for func, (_, _, _, _, callers) in stats.stats.items()
+        if not any(caller in stats.stats for caller in callers)
+    ]
+
+    stacks = {}
+
+    def walk(func, path, on_path, scale):
+        path = path + [function_label(func)]
+        own = stats.stats[func][2] * scale
+        if own >= min_seconds:
+            key = ";".join(path)
+            stacks[key] = stacks.get(key, 0) + own
+        if len(path) >= max_depth:
+            return
+        for callee, edge_time in callees.get(func, {}).items():
+            callee_time = stats.stats[callee][3]
+            if callee in on_path or callee_time <= 0:
+                continue
+            callee_scale = edge_time * scale / callee_time
+            if callee_time * callee_scale >= min_seconds:
+                walk(callee, path, on_path | {callee}, callee_scale)
+
+    for root in roots:
+        walk(root, [], {root}, 1.0)
+
+    return {stack: int(seconds * 1_000_000) for stack, seconds in stacks.items() if seconds * 1_000_000 >= 1}
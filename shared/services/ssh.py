@@ -0,0 +1,71 @@
+from nornir.core.inventory import ConnectionOptions
+import os
+
+DEFAULT_CONTROL_DIR = "~/.yapom/ssh"
+
+def control_master_options(persist: str, control_dir: str = DEFAULT_CONTROL_DIR) -> list:
+    """OpenSSH options for a shared, persistent master connection per device"""
+    control_dir = os.path.expanduser(control_dir)
+    # %C hashes host/port/user so socket paths stay short and unique
+    return [
+        "-o", "ControlMaster=auto",
+        "-o", f"ControlPath={control_dir}/%C",
+        "-o", f"ControlPersist={persist}"
+    ]
+
+def secure_control_dir(control_dir: str = DEFAULT_CONTROL_DIR) -> bool:
+    """Create the socket directory and make it private (0700) to the current user
+
+    makedirs' mode only applies to a new directory and is masked by the
+    umask, so the mode is set explicitly. A directory owned by someone else
+    is refused rather than used.
+    """
+    control_dir = os.path.expanduser(control_dir)
+    try:
+        os.makedirs(control_dir, mode=0o700, exist_ok=True)
+        if os.stat(control_dir).st_uid != os.getuid():
+            print(f"Not using SSH control directory {control_dir}: owned by another user")
+            return False
+        os.chmod(control_dir, 0o700)
+    except OSError as e:
+        print(f"Not using SSH control directory {control_dir}: {e}")
+        return False
+    return True
+
+def enable_connection_reuse(nr, persist: str, control_dir: str = DEFAULT_CONTROL_DIR) -> int:
+    """Make system-transport scrapli connections reuse OpenSSH ControlMaster sockets
+
+    The master process outlives the YAPOM run for `persist` (seconds or an
+    OpenSSH time string such as 10m), so the next invocation against the same
+    device skips key exchange and authentication.
+    """
+    if not secure_control_dir(control_dir):
+        return 0
+    open_cmd = control_master_options(persist, control_dir)
+
+    enabled = 0
+    for host in nr.inventory.hosts.values():
+        params = host.get_connection_parameters("scrapli")
+        extras = dict(params.extras or {})
+        if extras.get("transport", "system") != "system":
+            continue
+
+        transport_options = dict(extras.get("transport_options") or {})
+        transport_options["open_cmd"] = list(transport_options.get("open_cmd", [])) + open_cmd
+        extras["transport_options"] = transport_options
+
+        # Keep the host's own options and replace only extras; fields left
+        # unset still resolve through groups and defaults, including
+        # credentials set later
+        own = host.connection_options.get("scrapli")
+        host.connection_options["scrapli"] = ConnectionOptions(
+            hostname=own.hostname if own else None,
+            port=own.port if own else None,
+            username=own.username if own else None,
+            password=own.password if own else None,
+            platform=own.platform if own else None,
+            extras=extras
+        )
+        enabled += 1
+
+    return enabled
@@ -0,0 +1,58 @@
+import sqlite3
+import os
+
+# Columns for each record type, on top of the shared run/site/host/platform/command columns
+RECORD_COLUMNS = {
+    "interfaces": ["name", "ip_address", "status", "protocol"],
+    "routes": ["protocol", "prefix", "next_hop", "interface"],
+    "health": ["metric", "value"],
+    "inventory": ["name", "description", "pid", "serial"]
+}
+
+COMMON_COLUMNS = ["run_id", "site", "host", "platform", "command"]
+
+class ResultStore:
+    """SQLite store for parsed command output, partitioned by run and site"""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.create_tables()
+
+    def create_tables(self):
+        with self.conn:
+            for record_type, columns in RECORD_COLUMNS.items():
+                column_sql = ", ".join(f"{c} TEXT" for c in COMMON_COLUMNS)
+                column_sql += ", " + ", ".join(
+                    f"{c} REAL" if c == "value" else f"{c} TEXT" for c in columns
+                )
+                self.conn.execute(f"CREATE TABLE IF NOT EXISTS {record_type} ({column_sql})")
+                self.conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{record_type}_partition "
+                    f"ON {record_type} (run_id, site)"
+                )
+                self.conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{record_type}_host "
+                    f"ON {record_type} (host, run_id)"
+                )
+
+    def write(self, record_type: str, rows: list) -> int:
+        """Bulk insert rows (dicts carrying common and record columns)"""
+        if not rows:
+            return 0
+        columns = COMMON_COLUMNS + RECORD_COLUMNS[record_type]
+        placeholders = ", ".join("?" for _ in columns)
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO {record_type} ({', '.join(columns)}) VALUES ({placeholders})",
+                [tuple(row.get(c) for c in columns) for row in rows]
+            )
+        return len(rows)
+
+    def close(self):
+        self.conn.close()
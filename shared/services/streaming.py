@@ -0,0 +1,57 @@
+from collections import namedtuple
+import threading
+
+# Compact per-host bookkeeping kept in place of the full result tree
+CommandRecord = namedtuple("CommandRecord", ["host", "command", "failed", "error", "size"])
+
+class StreamingResultWriter:
+    """Nornir processor that hands each host's result off as soon as it completes
+
+    handle_result(host, multi_result) runs in the runner thread and should
+    persist the output. The processor then drops the output strings and scrapli
+    responses from the result so memory stays bounded by the runner's thread
+    count rather than the fleet size.
+    """
+
+    def __init__(self, command: str, handle_result):
+        self.command = command
+        self.handle_result = handle_result
+        self.records = []
+        self.lock = threading.Lock()
+
+    def task_started(self, task) -> None:
+        pass
+
+    def task_completed(self, task, result) -> None:
+        pass
+
+    def task_instance_started(self, task, host) -> None:
+        pass
+
+    def task_instance_completed(self, task, host, result) -> None:
+        output = None
+        try:
+            output = self.handle_result(host, result)
+        except Exception as e:
+            print(f"Error processing result for {host.name}: {str(e)}")
+
+        record = CommandRecord(
+            host=host.name,
+            command=self.command,
+            failed=result.failed,
+            error=str(result.exception) if result.failed else None,
+            size=len(output) if output else 0
+        )
+        for r in result:
+            r.result = None
+            if hasattr(r, "scrapli_response"):
+                r.scrapli_response = None
+
+        with self.lock:
+            self.records.append(record)
+
+    def subtask_instance_started(self, task, host) -> None:
+        pass
+
+    def subtask_instance_completed(self, task, host, result) -> None:
+        pass
@@ -0,0 +1,95 @@
+import json
+import os
+
+# scrapli's own default when a host does not set timeout_ops
+SCRAPLI_DEFAULT_TIMEOUT_OPS = 30.0
+
+class CommandTimings:
+    """Learned per-platform, per-command durations used to size ops timeouts"""
+
+    def __init__(
+        self,
+        path: str,
+        multiplier: float = 3.0,
+        min_timeout: float = 10.0,
+        max_timeout: float = 300.0,
+        smoothing: float = 0.3
+    ):
+        self.path = path
+        self.multiplier = multiplier
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.smoothing = smoothing
+        self.stats = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                self.stats = json.load(f)
+        except FileNotFoundError:
+            self.stats = {}
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable command timings {self.path}: {e}")
+            self.stats = {}
+
+    def save(self):
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(self.stats, f, indent=2)
+        except OSError as e:
+            print(f"Error saving command timings: {e}")
+
+    def timeout_for(self, platform: str, command: str):
+        """Ops timeout for a command, or None to keep the connection default
+
+        Quick commands get less than the connection's timeout_ops so a hung
+        device fails fast, and slow ones get more. Allowing 1.5x the slowest
+        run (timeouts included) keeps a device that has worked before from
+        being cut short.
+        """
+        stats = self.stats.get(platform, {}).get(command)
+        if not stats:
+            return None
+        timeout = max(stats["avg"] * self.multiplier, stats["max"] * 1.5)
+        return round(min(max(timeout, self.min_timeout), self.max_timeout), 1)
+
+    def record(self, platform: str, command: str, seconds: float) -> None:
+        """Fold a successful command duration into the running average"""
+        stats = self.stats.setdefault(platform, {}).get(command)
+        if not stats:
+            self.stats[platform][command] = {"avg": seconds, "max": seconds, "samples": 1}
+            return
+        stats["avg"] = round((1 - self.smoothing) * stats["avg"] + self.smoothing * seconds, 3)
+        stats["max"] = max(stats["max"], seconds)
+        stats["samples"] += 1
+
+    def record_timeout(self, platform: str, command: str, timeout: float) -> None:
+        """Back off after a timeout: the next run allows 1.5x the time that ran out"""
+        stats = self.stats.setdefault(platform, {}).setdefault(
+            command, {"avg": timeout, "max": timeout, "samples": 0}
+        )
+        stats["max"] = max(stats["max"], timeout)
+        stats["timeouts"] = stats.get("timeouts", 0) + 1
+
+def configured_timeout(nr) -> float:
+    """Largest timeout_ops configured for the hosts of a Nornir object"""
+    timeouts = [
+        (host.get_connection_parameters("scrapli").extras or {}).get("timeout_ops")
+        or SCRAPLI_DEFAULT_TIMEOUT_OPS
+        for host in nr.inventory.hosts.values()
+    ]
+    return float(max(timeouts, default=SCRAPLI_DEFAULT_TIMEOUT_OPS))
+
+def elapsed_time(host_data):
+    """Total scrapli elapsed time of a send_command(s) result, if available"""
+    result = host_data[0] if isinstance(host_data, list) else host_data
+    response = getattr(result, "scrapli_response", None)
+    if response is None:
+        return None
+    responses = response if isinstance(response, list) else [response]
+    elapsed = [r.elapsed_time for r in responses if getattr(r, "elapsed_time", None) is not None]
+    return sum(elapsed) if elapsed else None
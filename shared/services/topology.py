@@ -0,0 +1,101 @@
+# shared/services/topology.py
+
+def build_address_index(nr):
+    """Map every known address of an inventory host to its name"""
+    address_index = {}
+    for host in nr.inventory.hosts.values():
+        addresses = [host.hostname, host.data.get("router_id")]
+        addresses.extend(host.data.get("addresses", []))
+        for address in addresses:
+            if address:
+                address_index[str(address)] = host.name
+    return address_index
+
+def link_id(host_a, host_b):
+    """Stable identifier for the adjacency between two hosts"""
+    return " <-> ".join(sorted((host_a, host_b)))
+
+def session_link_id(host_name, peer, neighbor):
+    """Identifier for one session of a pair that has parallel adjacencies"""
+    return f"{link_id(host_name, peer)} [{host_name} {neighbor}]"
+
+def build_adjacency_graph(neighbor_tables, address_index, state_rank):
+    """Collapse per-device neighbor tables into fleet-wide links
+
+    neighbor_tables maps host name -> {neighbor: {"state": ..., "needs_investigation": ...}}.
+    The neighbor key (or the entry's "neighbor_id") is matched to an inventory
+    host through address_index.
+
+    When two inventory hosts see exactly one session to each other, both
+    views are mirrors of the same adjacency and end up on a single link.
+    Broken links get an "investigate_from" host, picked as the side whose
+    session is furthest along according to state_rank.
+
+    Parallel adjacencies (several sessions between the same pair, e.g. two
+    OSPF links or iBGP plus eBGP) cannot be paired reliably from neighbor
+    tables alone, so each of those sessions gets its own link investigated
+    from the side that reported it.
+    """
+    pairs = {}
+    for host_name, neighbors in neighbor_tables.items():
+        for neighbor, info in neighbors.items():
+            if not isinstance(info, dict):
+                continue
+            peer = address_index.get(neighbor) or address_index.get(info.get("neighbor_id"))
+            if peer is None or peer == host_name:
+                continue
+            sides = pairs.setdefault(link_id(host_name, peer), {})
+            sides.setdefault(host_name, {})[neighbor] = info
+
+    links = {}
+    for key, sides in pairs.items():
+        endpoints = key.split(" <-> ")
+        if all(len(sessions) == 1 for sessions in sides.values()):
+            groups = [(key, sides)]
+        else:
+            groups = [
+                (session_link_id(host_name, endpoints[1] if host_name == endpoints[0] else endpoints[0], neighbor),
+                 {host_name: {neighbor: info}})
+                for host_name, sessions in sides.items()
+                for neighbor, info in sessions.items()
+            ]
+
+        for group_key, group in groups:
+            link = {
+                "endpoints": endpoints,
+                "sessions": {
+                    host_name: {neighbor: info["state"] for neighbor, info in sessions.items()}
+                    for host_name, sessions in group.items()
+                },
+                "healthy": not any(
+                    info.get("needs_investigation")
+                    for sessions in group.values()
+                    for info in sessions.values()
+                ),
+                "investigate_from": None
+            }
+            if not link["healthy"]:
+                broken_sides = [
+                    host_name for host_name, sessions in group.items()
+                    if any(info.get("needs_investigation") for info in sessions.values())
+                ]
+                link["investigate_from"] = max(
+                    broken_sides,
+                    key=lambda host_name: (
+                        max(state_rank(state) for state in link["sessions"][host_name].values()),
+                        # Prefer the first endpoint by name on ties
+                        -endpoints.index(host_name)
+                    )
+                )
+            links[group_key] = link
+
+    return links
+
+def index_sessions(links):
+    """Map (host name, neighbor) to the id of the link carrying that session"""
+    return {
+        (host_name, neighbor): key
+        for key, link in links.items()
+        for host_name, sessions in link["sessions"].items()
+        for neighbor in sessions
+    }
@@ -0,0 +1,102 @@
+from datetime import datetime
+import hashlib
+import json
+import re
+from shared.services.parsers import get_parser
+from shared.services.neighbors import get_neighbor_parser
+
+# Fields identifying a parsed record when comparing polls
+RECORD_KEYS = {
+    "interfaces": ["name"],
+    "routes": ["prefix", "next_hop"],
+    "health": ["metric"],
+    "inventory": ["name"]
+}
+
+# Health metrics only count as changed beyond these margins
+PERCENT_TOLERANCE = 5.0
+RELATIVE_TOLERANCE = 0.05
+
+# Unparsed commands that are mostly counters and timers; every poll would
+# look like a change, so watch mode leaves them out
+WATCH_SKIPPED_COMMANDS = {
+    "show interfaces",
+    "show interface",
+    "show interfaces detail",
+    "show processes cpu sort",
+    "show system memory",
+    "show memory"
+}
+
+# Lines of otherwise stable output that move on every poll: uptimes, config
+# timestamps, NTP clock drift and free memory
+VOLATILE_LINE = re.compile(
+    r'uptime|last (?:configuration change|reload|reset)|nvram config last updated|'
+    r'current configuration :|clock-period|^! time:|free memory',
+    re.IGNORECASE
+)
+# Timers within a line: 00:01:23, 1w2d, 3d04h, "next due in 12 seconds"
+VOLATILE_VALUE = re.compile(r'\b\d+:\d{2}:\d{2}(?:\.\d+)?\b|\b\d+[ywdh]\d+[wdhm]\b|\bin \d+ seconds?\b')
+
+def stable_text(output: str) -> str:
+    """Output with volatile lines dropped and timers masked, for hashing"""
+    return "\n".join(
+        VOLATILE_VALUE.sub("<timer>", line)
+        for line in output.splitlines()
+        if not VOLATILE_LINE.search(line)
+    )
+
+def command_state(platform: str, command: str, output: str) -> dict:
+    """Comparable state of a command output
+
+    Neighbor tables and parsed records are compared field by field; other
+    output by a digest of its stable text.
+    """
+    neighbor_parser = get_neighbor_parser(platform, command)
+    if neighbor_parser:
+        return neighbor_state(neighbor_parser(output))
+    parser = get_parser(platform, command)
+    if not parser:
+        return {"digest": hashlib.sha1(stable_text(output).encode()).hexdigest()}
+    record_type, parse = parser
+    state = {}
+    for record in parse(output):
+        key = "|".join(str(record.get(field)) for field in RECORD_KEYS[record_type])
+        value = {k: v for k, v in record.items() if k not in RECORD_KEYS[record_type]}
+        state[key] = value["value"] if record_type == "health" else value
+    return state
+
+def neighbor_state(table: dict) -> dict:
+    """Comparable state of a neighbor table: neighbor -> state, with the prefix count for BGP"""
+    state = {}
+    for neighbor, info in table.items():
+        if not isinstance(info, dict):
+            continue
+        if "prefixes" in info:
+            state[neighbor] = {"state": info.get("state"), "prefixes": info.get("prefixes")}
+        else:
+            state[neighbor] = info.get("state")
+    return state
+
+def value_changed(key: str, old, new) -> bool:
+    if isinstance(old, float) and isinstance(new, float):
+        if key.endswith("_percent"):
+            return abs(new - old) >= PERCENT_TOLERANCE
+        return abs(new - old) > RELATIVE_TOLERANCE * max(abs(old), 1.0)
+    return old != new
+
+def diff_state(old: dict, new: dict) -> list:
+    """Compact list of changes between two states"""
+    changes = []
+    for key in sorted(set(old) | set(new)):
+        before = old.get(key)
+        after = new.get(key)
+        if key not in new or key not in old or value_changed(key, before, after):
+            changes.append({"key": key, "from": before, "to": after})
+    return changes
+
+def write_event(path: str, event: dict) -> None:
+    """Append one delta event to an NDJSON file"""
+    event = {"ts": datetime.now().isoformat(timespec="seconds"), **event}
+    with open(path, "a") as f:
+        f.write(json.dumps(event, default=str) + "\n")
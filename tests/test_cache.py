@@ -0,0 +1,15 @@
+from shared.services.cache import ResultCache
+
+def test_get_many_returns_fresh_entries_and_touches_them(tmp_path):
+    cache = ResultCache(str(tmp_path / "results.db"))
+    cache.put_many("show version", [("r1", "ios", "IOS 15.9"), ("r2", "ios", "IOS 17.3")])
+    cache.conn.execute("UPDATE results SET stored_at = stored_at - 7200, last_used = 0 WHERE host = 'r2'")
+
+    found = cache.get_many("show version", [("r1", "ios"), ("r2", "ios"), ("r3", "eos")])
+    assert list(found) == ["r1"]
+    assert found["r1"][0] == "IOS 15.9"
+    assert cache.hits == 1
+    last_used = dict(cache.conn.execute("SELECT host, last_used FROM results").fetchall())
+    assert last_used["r1"] >= found["r1"][1]
+    assert last_used["r2"] == 0
+    cache.close()
@@ -0,0 +1,96 @@
+from shared.services.neighbors import (
+    parse_bgp_summary,
+    parse_junos_bgp_summary,
+    bgp_state_rank,
+    parse_ospf_neighbors,
+    parse_junos_ospf_neighbors,
+    parse_eos_ospf_neighbors,
+    ospf_state_rank,
+    get_neighbor_parser
+)
+
+IOS_BGP_SUMMARY = """\
+BGP router identifier 1.1.1.1, local AS number 65001
+Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
+10.0.12.2       4        65002     120     118        5    0    0 01:45:10        3
+10.0.13.3       4        65003       0       0        1    0    0 never    Active
+"""
+
+JUNOS_BGP_SUMMARY = """\
+Groups: 2 Peers: 3 Down peers: 1
+Table          Tot Paths  Act Paths Suppressed    History Damp State    Pending
+inet.0                 5          4          0          0          0          0
+Peer                     AS      InPkt     OutPkt    OutQ   Flaps Last Up/Dwn State|#Active/Received/Accepted/Damped...
+10.0.12.2             65002        123        125       0       0    1w2d 3:04:05 2/3/3/0              0/0/0/0
+10.0.13.3             65003        240        238       0       1       55:12 Establ
+  inet.0: 2/2/2/0
+  inet6.0: 0/0/0/0
+10.0.14.4             65004          0          0       0       0     1:02:33 Active
+"""
+
+IOS_OSPF_NEIGHBORS = """\
+Neighbor ID     Pri   State           Dead Time   Address         Interface
+2.2.2.2           1   FULL/DR         00:00:35    10.0.12.2       GigabitEthernet0/0
+3.3.3.3           0   INIT/  -        00:00:33    10.0.13.3       GigabitEthernet0/1
+"""
+
+JUNOS_OSPF_NEIGHBORS = """\
+Address          Interface              State     ID               Pri  Dead
+10.0.12.2        ge-0/0/0.0             Full      2.2.2.2          128    36
+10.0.13.3        ge-0/0/1.0             ExStart   3.3.3.3          128    31
+"""
+
+EOS_OSPF_NEIGHBORS = """\
+Neighbor ID     Instance VRF      Pri State                  Dead Time   Address         Interface
+2.2.2.2         1        default  1   FULL/DR                00:00:35    10.0.12.2       Ethernet1
+3.3.3.3         1        default  0   FULL                   00:00:31    10.0.13.3       Ethernet2
+4.4.4.4         1        default  1   2WAY/DROTHER           00:00:38    10.0.14.4       Ethernet3
+"""
+
+def test_parse_bgp_summary():
+    neighbors = parse_bgp_summary(IOS_BGP_SUMMARY)
+    assert neighbors["10.0.12.2"] == {"state": "3", "prefixes": "3", "needs_investigation": False}
+    assert neighbors["10.0.13.3"]["needs_investigation"] is True
+
+def test_parse_junos_bgp_summary():
+    neighbors = parse_junos_bgp_summary(JUNOS_BGP_SUMMARY)
+    assert set(neighbors) == {"10.0.12.2", "10.0.13.3", "10.0.14.4"}
+    assert neighbors["10.0.12.2"] == {"state": "Establ", "prefixes": "3", "needs_investigation": False}
+    assert neighbors["10.0.13.3"] == {"state": "Establ", "prefixes": "2", "needs_investigation": False}
+    assert neighbors["10.0.14.4"] == {"state": "Active", "prefixes": "N/A", "needs_investigation": True}
+
+def test_bgp_state_rank():
+    assert bgp_state_rank("Establ") == bgp_state_rank("3") > bgp_state_rank("OpenConfirm") > bgp_state_rank("Idle")
+
+def test_parse_ospf_neighbors():
+    neighbors = parse_ospf_neighbors(IOS_OSPF_NEIGHBORS)
+    assert neighbors["10.0.12.2"] == {
+        "neighbor_id": "2.2.2.2", "state": "FULL", "interface": "GigabitEthernet0/0", "needs_investigation": False
+    }
+    assert neighbors["10.0.13.3"]["state"] == "INIT"
+    assert neighbors["10.0.13.3"]["needs_investigation"] is True
+
+def test_parse_junos_ospf_neighbors():
+    neighbors = parse_junos_ospf_neighbors(JUNOS_OSPF_NEIGHBORS)
+    assert neighbors["10.0.12.2"] == {
+        "neighbor_id": "2.2.2.2", "state": "FULL", "interface": "ge-0/0/0.0", "needs_investigation": False
+    }
+    assert neighbors["10.0.13.3"]["state"] == "EXSTART"
+    assert neighbors["10.0.13.3"]["needs_investigation"] is True
+    assert ospf_state_rank("FULL") > ospf_state_rank("EXSTART")
+
+def test_parse_eos_ospf_neighbors():
+    neighbors = parse_eos_ospf_neighbors(EOS_OSPF_NEIGHBORS)
+    assert parse_ospf_neighbors(EOS_OSPF_NEIGHBORS) == {}
+    assert neighbors["10.0.12.2"] == {
+        "neighbor_id": "2.2.2.2", "state": "FULL", "interface": "Ethernet1", "needs_investigation": False
+    }
+    assert neighbors["10.0.13.3"]["state"] == "FULL"
+    assert neighbors["10.0.14.4"]["state"] == "2WAY"
+    assert neighbors["10.0.14.4"]["needs_investigation"] is True
+
+def test_get_neighbor_parser():
+    assert get_neighbor_parser("junos", "show ospf neighbor") is parse_junos_ospf_neighbors
+    assert get_neighbor_parser("eos", "show ip ospf neighbor") is parse_eos_ospf_neighbors
+    assert get_neighbor_parser("ios", "show ip bgp summary | begin Neighbor") is parse_bgp_summary
+    assert get_neighbor_parser("ios", "show ip route") is None
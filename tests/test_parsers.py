@@ -0,0 +1,255 @@
+from shared.services.parsers import (
+    parse_ip_interface_brief,
+    parse_eos_ip_interface_brief,
+    parse_nxos_ip_interface_brief,
+    parse_junos_interfaces_terse,
+    parse_ip_route,
+    parse_nxos_ip_route,
+    parse_junos_route,
+    parse_ios_processes_cpu,
+    parse_ios_memory_statistics,
+    parse_nxos_system_resources,
+    parse_eos_processes_top,
+    parse_junos_processes_extensive,
+    parse_show_inventory,
+    parse_junos_chassis_hardware,
+    parse_eos_show_inventory,
+    get_parser
+)
+
+IOS_IP_ROUTE = """\
+Codes: L - local, C - connected, S - static, R - RIP, M - mobile, B - BGP
+       D - EIGRP, EX - EIGRP external, O - OSPF, IA - OSPF inter area
+
+Gateway of last resort is 10.0.12.2 to network 0.0.0.0
+
+S*    0.0.0.0/0 [1/0] via 10.0.12.2
+O*E2  0.0.0.0/0 [110/1] via 10.0.13.2, 00:03:11, GigabitEthernet0/1
+      10.0.0.0/8 is variably subnetted, 2 subnets, 2 masks
+C        10.0.12.0/24 is directly connected, GigabitEthernet0/0
+L        10.0.12.1/32 is directly connected, GigabitEthernet0/0
+      172.16.0.0/24 is subnetted, 2 subnets
+O        172.16.1.0 [110/2] via 10.0.12.2, 00:01:02, GigabitEthernet0/0
+                    [110/2] via 10.0.13.2, 00:01:02, GigabitEthernet0/1
+O IA     172.16.2.0 [110/3] via 10.0.13.2, 00:01:02, GigabitEthernet0/1
+O E2     192.168.100.0/24
+           [110/20] via 10.0.12.2, 00:00:10, GigabitEthernet0/0
+"""
+
+def test_ios_ip_interface_brief():
+    output = """\
+Interface              IP-Address      OK? Method Status                Protocol
+GigabitEthernet0/0     192.168.1.1     YES NVRAM  up                    up
+GigabitEthernet0/1     unassigned      YES NVRAM  administratively down down
+"""
+    assert parse_ip_interface_brief(output) == [
+        {"name": "GigabitEthernet0/0", "ip_address": "192.168.1.1", "status": "up", "protocol": "up"},
+        {"name": "GigabitEthernet0/1", "ip_address": None, "status": "administratively down", "protocol": "down"}
+    ]
+
+def test_eos_ip_interface_brief():
+    output = """\
+                                                                             Address
+Interface         IP Address            Status       Protocol         MTU    Owner
+----------------- --------------------- ------------ -------------- -------- -------
+Ethernet1         10.0.0.1/31           up           up               1500
+Loopback0         1.1.1.1/32            up           up              65535
+"""
+    records = parse_eos_ip_interface_brief(output)
+    assert records[0] == {"name": "Ethernet1", "ip_address": "10.0.0.1/31", "status": "up", "protocol": "up"}
+    assert records[1]["name"] == "Loopback0"
+
+def test_nxos_ip_interface_brief():
+    output = """\
+IP Interface Status for VRF "default"(1)
+Interface            IP Address      Interface Status
+Lo0                  1.1.1.1         protocol-up/link-up/admin-up
+Eth1/1               10.0.0.1        protocol-down/link-down/admin-up
+"""
+    assert parse_nxos_ip_interface_brief(output) == [
+        {"name": "Lo0", "ip_address": "1.1.1.1", "status": "up", "protocol": "up"},
+        {"name": "Eth1/1", "ip_address": "10.0.0.1", "status": "up", "protocol": "down"}
+    ]
+
+def test_junos_interfaces_terse():
+    output = """\
+Interface               Admin Link Proto    Local                 Remote
+ge-0/0/0                up    up
+ge-0/0/0.0              up    up   inet     10.0.0.1/30
+ge-0/0/1                up    down
+"""
+    assert parse_junos_interfaces_terse(output) == [
+        {"name": "ge-0/0/0", "ip_address": None, "status": "up", "protocol": "up"},
+        {"name": "ge-0/0/0.0", "ip_address": "10.0.0.1/30", "status": "up", "protocol": "up"},
+        {"name": "ge-0/0/1", "ip_address": None, "status": "up", "protocol": "down"}
+    ]
+
+def test_ios_ip_route():
+    assert parse_ip_route(IOS_IP_ROUTE) == [
+        {"protocol": "S", "prefix": "0.0.0.0/0", "next_hop": "10.0.12.2", "interface": None},
+        {"protocol": "O E2", "prefix": "0.0.0.0/0", "next_hop": "10.0.13.2", "interface": "GigabitEthernet0/1"},
+        {"protocol": "C", "prefix": "10.0.12.0/24", "next_hop": None, "interface": "GigabitEthernet0/0"},
+        {"protocol": "L", "prefix": "10.0.12.1/32", "next_hop": None, "interface": "GigabitEthernet0/0"},
+        {"protocol": "O", "prefix": "172.16.1.0/24", "next_hop": "10.0.12.2", "interface": "GigabitEthernet0/0"},
+        {"protocol": "O", "prefix": "172.16.1.0/24", "next_hop": "10.0.13.2", "interface": "GigabitEthernet0/1"},
+        {"protocol": "O IA", "prefix": "172.16.2.0/24", "next_hop": "10.0.13.2", "interface": "GigabitEthernet0/1"},
+        {"protocol": "O E2", "prefix": "192.168.100.0/24", "next_hop": "10.0.12.2", "interface": "GigabitEthernet0/0"}
+    ]
+
+def test_eos_ip_route_ecmp():
+    output = """\
+O        10.1.0.0/24 [110/20] via 10.0.0.1, Ethernet1
+                              via 10.0.0.3, Ethernet2
+C        10.0.0.0/31 is directly connected, Ethernet1
+"""
+    assert parse_ip_route(output) == [
+        {"protocol": "O", "prefix": "10.1.0.0/24", "next_hop": "10.0.0.1", "interface": "Ethernet1"},
+        {"protocol": "O", "prefix": "10.1.0.0/24", "next_hop": "10.0.0.3", "interface": "Ethernet2"},
+        {"protocol": "C", "prefix": "10.0.0.0/31", "next_hop": None, "interface": "Ethernet1"}
+    ]
+
+def test_nxos_ip_route():
+    output = """\
+10.0.0.0/24, ubest/mbest: 2/0
+    *via 10.1.1.2, Eth1/1, [110/41], 00:01:02, ospf-1, intra
+    *via 10.1.2.2, Eth1/2, [110/41], 00:01:02, ospf-1, intra
+"""
+    assert parse_nxos_ip_route(output) == [
+        {"protocol": "ospf", "prefix": "10.0.0.0/24", "next_hop": "10.1.1.2", "interface": "Eth1/1"},
+        {"protocol": "ospf", "prefix": "10.0.0.0/24", "next_hop": "10.1.2.2", "interface": "Eth1/2"}
+    ]
+
+def test_junos_route():
+    output = """\
+inet.0: 3 destinations, 3 routes (3 active, 0 holddown, 0 hidden)
++ = Active Route, - = Last Active, * = Both
+
+10.0.0.0/24        *[OSPF/10] 00:01:02, metric 2
+                    > to 10.1.1.2 via ge-0/0/0.0
+10.1.1.0/30        *[Direct/0] 1d 02:03:04
+                    > via ge-0/0/0.0
+"""
+    assert parse_junos_route(output) == [
+        {"protocol": "OSPF", "prefix": "10.0.0.0/24", "next_hop": "10.1.1.2", "interface": "ge-0/0/0.0"},
+        {"protocol": "Direct", "prefix": "10.1.1.0/30", "next_hop": None, "interface": "ge-0/0/0.0"}
+    ]
+
+def test_ios_health():
+    cpu = "CPU utilization for five seconds: 5%/0%; one minute: 3%; five minutes: 2%\n"
+    assert parse_ios_processes_cpu(cpu) == [
+        {"metric": "cpu_5s_percent", "value": 5.0},
+        {"metric": "cpu_1m_percent", "value": 3.0},
+        {"metric": "cpu_5m_percent", "value": 2.0}
+    ]
+    memory = """\
+                Head    Total(b)     Used(b)     Free(b)   Lowest(b)  Largest(b)
+Processor  7F6E4B1A3010   821525784   219452960   602072824   597584232   569378924
+"""
+    assert parse_ios_memory_statistics(memory) == [
+        {"metric": "memory_total_bytes", "value": 821525784.0},
+        {"metric": "memory_used_bytes", "value": 219452960.0},
+        {"metric": "memory_free_bytes", "value": 602072824.0}
+    ]
+
+def test_nxos_system_resources():
+    output = """\
+CPU states  :   3.50% user,   2.00% kernel,   94.50% idle
+Memory usage:   8167228K total,   5194080K used,   2973148K free
+"""
+    assert parse_nxos_system_resources(output) == [
+        {"metric": "cpu_percent", "value": 5.5},
+        {"metric": "memory_total_bytes", "value": 8167228.0 * 1024},
+        {"metric": "memory_used_bytes", "value": 5194080.0 * 1024},
+        {"metric": "memory_free_bytes", "value": 2973148.0 * 1024}
+    ]
+
+def test_eos_processes_top():
+    output = """\
+top - 10:00:00 up 10 days,  1 user,  load average: 0.50, 0.40, 0.30
+%Cpu(s):  4.0 us,  1.0 sy,  0.0 ni, 95.0 id,  0.0 wa,  0.0 hi,  0.0 si,  0.0 st
+KiB Mem :  8000000 total,  2000000 free,  5000000 used,  1000000 buff/cache
+"""
+    assert parse_eos_processes_top(output) == [
+        {"metric": "cpu_percent", "value": 5.0},
+        {"metric": "memory_total_bytes", "value": 8000000.0 * 1024},
+        {"metric": "memory_free_bytes", "value": 2000000.0 * 1024},
+        {"metric": "memory_used_bytes", "value": 5000000.0 * 1024}
+    ]
+
+def test_junos_processes_extensive():
+    output = """\
+last pid: 12345;  load averages:  0.10,  0.20,  0.15  up 10+02:03:04    10:00:00
+150 processes: 2 running, 148 sleeping
+CPU:  2.3% user,  0.0% nice,  1.5% system,  0.2% interrupt, 96.0% idle
+Mem: 500M Active, 100M Inact, 200M Wired, 50M Buf, 1000M Free
+Swap: 2048M Total, 2048M Free
+"""
+    mb = 1024 ** 2
+    assert parse_junos_processes_extensive(output) == [
+        {"metric": "cpu_percent", "value": 4.0},
+        {"metric": "memory_total_bytes", "value": 1800.0 * mb},
+        {"metric": "memory_used_bytes", "value": 800.0 * mb},
+        {"metric": "memory_free_bytes", "value": 1000.0 * mb}
+    ]
+
+def test_show_inventory():
+    output = """\
+NAME: "Chassis", DESCR: "Cisco IOSv Chassis"
+PID: IOSv              , VID: 1.0, SN: 9ABCDEF1234
+
+NAME: "Slot 1", DESCR: "Line card"
+PID: LC-1              , VID: V01, SN: FOC1234
+"""
+    assert parse_show_inventory(output) == [
+        {"name": "Chassis", "description": "Cisco IOSv Chassis", "pid": "IOSv", "serial": "9ABCDEF1234"},
+        {"name": "Slot 1", "description": "Line card", "pid": "LC-1", "serial": "FOC1234"}
+    ]
+
+def test_junos_chassis_hardware():
+    output = """\
+Hardware inventory:
+Item             Version  Part number  Serial number     Description
+Chassis                                JN11F0A1AAFC      MX480
+Midplane         REV 07   750-047862   ACRB1234          Enhanced MX480 Midplane
+FPC 0            REV 22   750-045372   CADM1234          MPCE Type 2 3D
+  CPU            REV 10   711-038484   CADK1234          MPCE PMB 2G
+"""
+    assert parse_junos_chassis_hardware(output) == [
+        {"name": "Chassis", "description": "MX480", "pid": None, "serial": "JN11F0A1AAFC"},
+        {"name": "Midplane", "description": "Enhanced MX480 Midplane", "pid": "750-047862", "serial": "ACRB1234"},
+        {"name": "FPC 0", "description": "MPCE Type 2 3D", "pid": "750-045372", "serial": "CADM1234"},
+        {"name": "CPU", "description": "MPCE PMB 2G", "pid": "711-038484", "serial": "CADK1234"}
+    ]
+
+def test_eos_show_inventory():
+    output = """\
+System information
+  Model                    Description
+  ------------------------ ----------------------------------------------------
+  DCS-7280SR-48C6          48x10GbE SFP+ & 6x100GbE QSFP100 switch
+
+  HW Version  Serial Number  Mfg Date
+  ----------- -------------- ----------
+  11.01       JPE12345678    2018-01-01
+
+System has 54 ports
+  Type               Count
+  ---------------- ----
+  Switched           54
+
+System has 54 transceiver slots
+  Port Manufacturer     Model            Serial Number    Rev
+  ---- ---------------- ---------------- ---------------- ----
+  1    Arista Networks  SFP-10G-SR       XCW1234          0002
+  2    Not Present
+"""
+    assert parse_eos_show_inventory(output) == [
+        {"name": "Chassis", "pid": "DCS-7280SR-48C6",
+         "description": "48x10GbE SFP+ & 6x100GbE QSFP100 switch", "serial": "JPE12345678"},
+        {"name": "Port 1", "description": "Arista Networks", "pid": "SFP-10G-SR", "serial": "XCW1234"}
+    ]
+
+def test_get_parser():
+    assert get_parser("IOS", "show ip route") == ("routes", parse_ip_route)
+    assert get_parser("junos", "show chassis hardware")[0] == "inventory"
+    assert get_parser("ios", "show logging") is None
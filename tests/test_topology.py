@@ -0,0 +1,93 @@
+from shared.services.topology import build_adjacency_graph, index_sessions
+
+STATES = ["DOWN", "INIT", "2WAY", "EXSTART", "FULL"]
+
+def rank(state):
+    return STATES.index(state)
+
+def session(state, **extra):
+    return {"state": state, "needs_investigation": state != "FULL", **extra}
+
+ADDRESS_INDEX = {
+    "10.0.12.1": "r1", "10.0.13.1": "r1", "1.1.1.1": "r1",
+    "10.0.12.2": "r2", "10.0.22.2": "r2", "2.2.2.2": "r2",
+    "10.0.13.3": "r3"
+}
+
+def test_mirrored_sessions_collapse_to_one_link():
+    links = build_adjacency_graph(
+        {"r1": {"10.0.12.2": session("FULL")}, "r2": {"10.0.12.1": session("FULL")}},
+        ADDRESS_INDEX, rank
+    )
+    assert list(links) == ["r1 <-> r2"]
+    link = links["r1 <-> r2"]
+    assert link["endpoints"] == ["r1", "r2"]
+    assert link["sessions"] == {"r1": {"10.0.12.2": "FULL"}, "r2": {"10.0.12.1": "FULL"}}
+    assert link["healthy"] is True
+    assert link["investigate_from"] is None
+    assert index_sessions(links) == {("r1", "10.0.12.2"): "r1 <-> r2", ("r2", "10.0.12.1"): "r1 <-> r2"}
+
+def test_investigate_from_the_more_advanced_side():
+    links = build_adjacency_graph(
+        {"r1": {"10.0.12.2": session("INIT")}, "r2": {"10.0.12.1": session("EXSTART")}},
+        ADDRESS_INDEX, rank
+    )
+    assert links["r1 <-> r2"]["healthy"] is False
+    assert links["r1 <-> r2"]["investigate_from"] == "r2"
+
+def test_investigate_from_ties_break_by_name():
+    links = build_adjacency_graph(
+        {"r2": {"10.0.12.1": session("INIT")}, "r1": {"10.0.12.2": session("INIT")}},
+        ADDRESS_INDEX, rank
+    )
+    assert links["r1 <-> r2"]["investigate_from"] == "r1"
+
+def test_only_the_broken_side_is_investigated():
+    links = build_adjacency_graph(
+        {"r1": {"10.0.12.2": session("FULL")}, "r2": {"10.0.12.1": session("INIT")}},
+        ADDRESS_INDEX, rank
+    )
+    assert links["r1 <-> r2"]["investigate_from"] == "r2"
+
+def test_parallel_sessions_stay_separate():
+    links = build_adjacency_graph(
+        {
+            "r1": {"10.0.12.2": session("FULL"), "10.0.22.2": session("INIT")},
+            "r2": {"10.0.12.1": session("FULL")}
+        },
+        ADDRESS_INDEX, rank
+    )
+    assert set(links) == {
+        "r1 <-> r2 [r1 10.0.12.2]",
+        "r1 <-> r2 [r1 10.0.22.2]",
+        "r1 <-> r2 [r2 10.0.12.1]"
+    }
+    broken = links["r1 <-> r2 [r1 10.0.22.2]"]
+    assert broken["sessions"] == {"r1": {"10.0.22.2": "INIT"}}
+    assert broken["investigate_from"] == "r1"
+    assert links["r1 <-> r2 [r1 10.0.12.2]"]["healthy"] is True
+    sessions = index_sessions(links)
+    assert sessions[("r1", "10.0.22.2")] == "r1 <-> r2 [r1 10.0.22.2]"
+    assert sessions[("r2", "10.0.12.1")] == "r1 <-> r2 [r2 10.0.12.1]"
+
+def test_peer_without_a_neighbor_table():
+    # r3 is in the inventory but its table could not be collected
+    links = build_adjacency_graph({"r1": {"10.0.13.3": session("INIT")}}, ADDRESS_INDEX, rank)
+    assert links["r1 <-> r3"]["sessions"] == {"r1": {"10.0.13.3": "INIT"}}
+    assert links["r1 <-> r3"]["investigate_from"] == "r1"
+
+def test_neighbor_outside_the_inventory_is_ignored():
+    links = build_adjacency_graph(
+        {"r1": {"192.0.2.9": session("INIT")}, "r2": {"10.0.12.1": session("FULL")}},
+        ADDRESS_INDEX, rank
+    )
+    assert set(links) == {"r1 <-> r2"}
+    assert links["r1 <-> r2"]["sessions"] == {"r2": {"10.0.12.1": "FULL"}}
+    assert ("r1", "192.0.2.9") not in index_sessions(links)
+
+def test_peer_resolved_by_neighbor_id():
+    links = build_adjacency_graph(
+        {"r1": {"10.9.9.9": session("FULL", neighbor_id="2.2.2.2")}, "r2": {"10.0.12.1": session("FULL")}},
+        ADDRESS_INDEX, rank
+    )
+    assert set(links) == {"r1 <-> r2"}
@@ -0,0 +1,62 @@
+from shared.services.watch import command_state, neighbor_state, diff_state, stable_text
+
+IOS_OSPF_NEIGHBORS = """\
+Neighbor ID     Pri   State           Dead Time   Address         Interface
+2.2.2.2           1   FULL/DR         00:00:{dead}    10.0.12.2       GigabitEthernet0/0
+"""
+
+IOS_VERSION = """\
+Cisco IOS Software, C2900 Software (C2900-UNIVERSALK9-M), Version 15.7(3)M5
+router1 uptime is 2 weeks, 3 days, {hours} hours, 12 minutes
+System image file is "flash:c2900-universalk9-mz.SPA.157-3.M5.bin"
+"""
+
+IOS_PROTOCOLS = """\
+Routing Protocol is "ospf 1"
+  Routing Information Sources:
+    Gateway         Distance      Last Update
+    2.2.2.2              110      {last_update}
+"""
+
+JUNOS_BGP_SUMMARY = """\
+Peer                     AS      InPkt     OutPkt    OutQ   Flaps Last Up/Dwn State|#Active/Received/Accepted/Damped...
+10.0.12.2             65002        {pkts}        125       0       0       55:{secs} Establ
+  inet.0: {active}/{received}/{received}/0
+"""
+
+def no_event(platform, command, first, second):
+    return diff_state(command_state(platform, command, first), command_state(platform, command, second)) == []
+
+def test_timer_only_changes_produce_no_event():
+    assert no_event("ios", "show ip ospf neighbor",
+                    IOS_OSPF_NEIGHBORS.format(dead="35"), IOS_OSPF_NEIGHBORS.format(dead="31"))
+    assert no_event("ios", "show version",
+                    IOS_VERSION.format(hours=4), IOS_VERSION.format(hours=5))
+    assert no_event("ios", "show ip protocols",
+                    IOS_PROTOCOLS.format(last_update="00:01:02"), IOS_PROTOCOLS.format(last_update="1d02h"))
+    assert no_event("junos", "show bgp summary",
+                    JUNOS_BGP_SUMMARY.format(pkts=123, secs=12, active=2, received=3),
+                    JUNOS_BGP_SUMMARY.format(pkts=140, secs=48, active=2, received=3))
+
+def test_real_changes_produce_events():
+    assert diff_state(
+        command_state("ios", "show ip ospf neighbor", IOS_OSPF_NEIGHBORS.format(dead="35")),
+        command_state("ios", "show ip ospf neighbor", IOS_OSPF_NEIGHBORS.format(dead="35").replace("FULL/DR", "INIT/DROTHER"))
+    ) == [{"key": "10.0.12.2", "from": "FULL", "to": "INIT"}]
+    assert not no_event("ios", "show version",
+                        IOS_VERSION.format(hours=4), IOS_VERSION.format(hours=4).replace("15.7(3)M5", "15.9(3)M2"))
+
+def test_junos_prefix_count_change_is_reported():
+    before = command_state("junos", "show bgp summary", JUNOS_BGP_SUMMARY.format(pkts=123, secs=12, active=2, received=3))
+    after = command_state("junos", "show bgp summary", JUNOS_BGP_SUMMARY.format(pkts=140, secs=48, active=2, received=7))
+    assert diff_state(before, after) == [{
+        "key": "10.0.12.2",
+        "from": {"state": "Establ", "prefixes": "3"},
+        "to": {"state": "Establ", "prefixes": "7"}
+    }]
+
+def test_neighbor_state_keeps_ospf_states_flat():
+    assert neighbor_state({"10.0.12.2": {"state": "FULL", "interface": "Gi0/0"}, "error": "x"}) == {"10.0.12.2": "FULL"}
+
+def test_stable_text():
+    assert stable_text("Last configuration change at 10:11:12 UTC\nhostname r1\nntp clock-period 17179869\n") == "hostname r1"
@@ -1,47 +1,35 @@
 # workers/bgp_analysis.py
 
 from nornir_scrapli.tasks import send_command
-import re
 import json
 from datetime import datetime
 import os
+from shared.services.mod import get_filtered_command
+from shared.services.topology import build_address_index, build_adjacency_graph, index_sessions
+from shared.services.neighbors import BGP_SUMMARY_PARSERS, parse_bgp_summary, bgp_state_rank
 
 def analyze_bgp_summary(task):
     """Analyze BGP summary output"""
+    platform = task.host.platform
     result = task.run(
         task=send_command,
-        command="show ip bgp summary"
+        command=get_filtered_command(platform, "bgp_summary")
     )
     
     if result.failed:
         return {"error": str(result.exception)}
-        
-    output = result.result
-    neighbors = {}
-    
-    # Parse BGP summary
-    for line in output.splitlines():
-        if re.match(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}', line):
-            fields = line.split()
-            neighbor_ip = fields[0]
-            state = fields[-1]
-            prefixes = fields[-2] if len(fields) > 2 else "N/A"
-            
-            neighbors[neighbor_ip] = {
-                "state": state,
-                "prefixes": prefixes,
-                "needs_investigation": not state.isdigit()
-            }
     
-    return neighbors
+    parser = BGP_SUMMARY_PARSERS.get(platform, parse_bgp_summary)
+    return parser(result.result)
 
 def check_bgp_neighbor(task, neighbor_ip):
     """Detailed check of a specific BGP neighbor"""
+    platform = task.host.platform
     commands = [
-        f"show ip bgp neighbor {neighbor_ip}",
-        f"show ip bgp neighbor {neighbor_ip} advertised-routes",
-        f"show ip bgp neighbor {neighbor_ip} received-routes",
-        "show ip route bgp"
+        get_filtered_command(platform, "bgp_neighbor", neighbor_ip=neighbor_ip),
+        get_filtered_command(platform, "bgp_advertised_routes", neighbor_ip=neighbor_ip),
+        get_filtered_command(platform, "bgp_received_routes", neighbor_ip=neighbor_ip),
+        get_filtered_command(platform, "bgp_routes")
     ]
     
     neighbor_details = {}
@@ -59,38 +47,63 @@ def run_task(nr, timestamp=None):
     """Main worker function for BGP analysis"""
     analysis_results = {}
     
+    # Step 1: Get BGP summary from every device in one pass
+    print("\nCollecting BGP summaries...")
+    # on_failed also polls hosts that failed an earlier command of the run
+    summary_result = nr.run(task=analyze_bgp_summary, on_failed=True)
+    
+    bgp_summaries = {}
     for host in nr.inventory.hosts.values():
-        print(f"\nAnalyzing BGP on {host.name}...")
-        host_results = {
+        analysis_results[host.name] = {
             "summary": None,
             "problem_neighbors": {},
             "routes": None
         }
+        host_result = summary_result.get(host.name)
+        if host_result is not None and not host_result.failed:
+            bgp_summaries[host.name] = host_result[0].result
+            analysis_results[host.name]["summary"] = bgp_summaries[host.name]
+    
+    # Step 2: Correlate sessions between inventory hosts into links
+    address_index = build_address_index(nr)
+    links = build_adjacency_graph(bgp_summaries, address_index, bgp_state_rank)
+    sessions = index_sessions(links)
+    
+    # Step 3: Check problematic neighbors, once per broken link
+    for host_name, bgp_summary in bgp_summaries.items():
+        print(f"\nAnalyzing BGP on {host_name}...")
+        host_results = analysis_results[host_name]
         
-        # Step 1: Get BGP summary
-        summary_result = nr.filter(name=host.name).run(
-            task=analyze_bgp_summary
-        )
-        
-        if not summary_result[host.name].failed:
-            bgp_summary = summary_result[host.name][0]
-            host_results["summary"] = bgp_summary
+        for neighbor_ip, info in bgp_summary.items():
+            if not isinstance(info, dict) or not info.get("needs_investigation"):
+                continue
             
-            # Step 2: Check problematic neighbors
-            for neighbor_ip, info in bgp_summary.items():
-                if info.get("needs_investigation"):
-                    print(f"  Investigating neighbor {neighbor_ip}...")
-                    details = nr.filter(name=host.name).run(
-                        task=check_bgp_neighbor,
-                        neighbor_ip=neighbor_ip
-                    )
-                    if not details[host.name].failed:
-                        host_results["problem_neighbors"][neighbor_ip] = {
-                            "state": info["state"],
-                            "details": details[host.name][0]
-                        }
-        
-        analysis_results[host.name] = host_results
+            key = sessions.get((host_name, neighbor_ip))
+            link = links.get(key)
+            if link and link["investigate_from"] != host_name:
+                print(f"  Neighbor {neighbor_ip} is covered from {link['investigate_from']}")
+                host_results["problem_neighbors"][neighbor_ip] = {
+                    "state": info["state"],
+                    "link": key,
+                    "investigated_from": link["investigate_from"]
+                }
+                continue
+            
+            print(f"  Investigating neighbor {neighbor_ip}...")
+            details = nr.filter(name=host_name).run(
+                task=check_bgp_neighbor,
+                on_failed=True,
+                neighbor_ip=neighbor_ip
+            )
+            host_details = details.get(host_name)
+            if host_details is not None and not host_details.failed:
+                host_results["problem_neighbors"][neighbor_ip] = {
+                    "state": info["state"],
+                    "link": key,
+                    "details": host_details[0].result
+                }
+    
+    analysis_results["links"] = links
     
     # Save results
     if timestamp:
@@ -105,7 +118,8 @@ def run_task(nr, timestamp=None):
             f.write("BGP Analysis Summary\n")
             f.write("=" * 50 + "\n\n")
             
-            for host, results in analysis_results.items():
+            for host in nr.inventory.hosts:
+                results = analysis_results[host]
                 f.write(f"Device: {host}\n")
                 f.write("-" * 30 + "\n")
                 
@@ -118,8 +132,19 @@ def run_task(nr, timestamp=None):
                 if results["problem_neighbors"]:
                     f.write("\nProblem Neighbors:\n")
                     for neighbor, info in results["problem_neighbors"].items():
-                        f.write(f"- {neighbor}: {info['state']}\n")
+                        covered = f" (investigated from {info['investigated_from']})" if "investigated_from" in info else ""
+                        f.write(f"- {neighbor}: {info['state']}{covered}\n")
                 
                 f.write("\n")
+            
+            if links:
+                f.write("Links\n")
+                f.write("-" * 30 + "\n")
+                for key, link in links.items():
+                    status = "✓" if link["healthy"] else "✗"
+                    f.write(f"{status} {key}")
+                    if link["investigate_from"]:
+                        f.write(f" (investigated from {link['investigate_from']})")
+                    f.write("\n")
     
     return analysis_results
\ No newline at end of file
@@ -1,46 +1,34 @@
 # workers/ospf_analysis.py
 
 from nornir_scrapli.tasks import send_command
-import re
 import json
 import os
 from datetime import datetime
+from shared.services.mod import get_filtered_command
+from shared.services.topology import build_address_index, build_adjacency_graph, index_sessions
+from shared.services.neighbors import OSPF_NEIGHBOR_PARSERS, parse_ospf_neighbors, ospf_state_rank
 
 def analyze_ospf_neighbors(task):
     """Analyze OSPF neighbor states"""
+    platform = task.host.platform
     result = task.run(
         task=send_command,
-        command="show ip ospf neighbor"
+        command=get_filtered_command(platform, "ospf_neighbors")
     )
     
     if result.failed:
         return {"error": str(result.exception)}
-        
-    output = result.result
-    neighbors = {}
-    
-    # Parse OSPF neighbors
-    for line in output.splitlines():
-        match = re.search(r'(\d+\.\d+\.\d+\.\d+)\s+\d+\s+(\w+/\w+)\s+(\w+)', line)
-        if match:
-            neighbor_ip = match.group(1)
-            state = match.group(3)
-            interface = match.group(2)
-            
-            neighbors[neighbor_ip] = {
-                "state": state,
-                "interface": interface,
-                "needs_investigation": state != "FULL"
-            }
     
-    return neighbors
+    parser = OSPF_NEIGHBOR_PARSERS.get(platform, parse_ospf_neighbors)
+    return parser(result.result)
 
 def check_ospf_interface(task, interface):
     """Check OSPF interface details"""
+    platform = task.host.platform
     commands = [
-        f"show ip ospf interface {interface}",
-        f"show interface {interface}",
-        f"show ip route ospf"
+        get_filtered_command(platform, "ospf_interface", interface=interface),
+        get_filtered_command(platform, "interface", interface=interface),
+        get_filtered_command(platform, "ospf_routes")
     ]
     
     interface_details = {}
@@ -58,41 +46,63 @@ def run_task(nr, timestamp=None):
     """Main worker function for OSPF analysis"""
     analysis_results = {}
     
+    # Step 1: Get OSPF neighbors from every device in one pass
+    print("\nCollecting OSPF neighbors...")
+    # on_failed also polls hosts that failed an earlier command of the run
+    neighbor_result = nr.run(task=analyze_ospf_neighbors, on_failed=True)
+    
+    ospf_tables = {}
     for host in nr.inventory.hosts.values():
-        print(f"\nAnalyzing OSPF on {host.name}...")
-        host_results = {
+        analysis_results[host.name] = {
             "neighbors": None,
             "problem_interfaces": {},
             "routes": None
         }
+        host_result = neighbor_result.get(host.name)
+        if host_result is not None and not host_result.failed:
+            ospf_tables[host.name] = host_result[0].result
+            analysis_results[host.name]["neighbors"] = ospf_tables[host.name]
+    
+    # Step 2: Correlate adjacencies between inventory hosts into links
+    address_index = build_address_index(nr)
+    links = build_adjacency_graph(ospf_tables, address_index, ospf_state_rank)
+    sessions = index_sessions(links)
+    
+    # Step 3: Check problematic interfaces, once per broken link
+    for host_name, ospf_neighbors in ospf_tables.items():
+        print(f"\nAnalyzing OSPF on {host_name}...")
+        host_results = analysis_results[host_name]
         
-        # Step 1: Get OSPF neighbors
-        neighbor_result = nr.filter(name=host.name).run(
-            task=analyze_ospf_neighbors
-        )
-        
-        if not neighbor_result[host.name].failed:
-            ospf_neighbors = neighbor_result[host.name][0]
-            host_results["neighbors"] = ospf_neighbors
+        checked_interfaces = set()
+        for neighbor_ip, info in ospf_neighbors.items():
+            if not isinstance(info, dict):
+                continue
+            interface = info["interface"]
+            if not info.get("needs_investigation") or interface in checked_interfaces:
+                continue
             
-            # Step 2: Check problematic interfaces
-            checked_interfaces = set()
-            for neighbor_ip, info in ospf_neighbors.items():
-                interface = info["interface"]
-                if info.get("needs_investigation") and interface not in checked_interfaces:
-                    print(f"  Investigating interface {interface}...")
-                    details = nr.filter(name=host.name).run(
-                        task=check_ospf_interface,
-                        interface=interface
-                    )
-                    if not details[host.name].failed:
-                        host_results["problem_interfaces"][interface] = {
-                            "neighbor_ips": [n for n, i in ospf_neighbors.items() if i["interface"] == interface],
-                            "details": details[host.name][0]
-                        }
-                    checked_interfaces.add(interface)
-        
-        analysis_results[host.name] = host_results
+            key = sessions.get((host_name, neighbor_ip))
+            link = links.get(key)
+            if link and link["investigate_from"] != host_name:
+                print(f"  Neighbor {neighbor_ip} is covered from {link['investigate_from']}")
+                continue
+            
+            print(f"  Investigating interface {interface}...")
+            details = nr.filter(name=host_name).run(
+                task=check_ospf_interface,
+                on_failed=True,
+                interface=interface
+            )
+            host_details = details.get(host_name)
+            if host_details is not None and not host_details.failed:
+                host_results["problem_interfaces"][interface] = {
+                    "neighbor_ips": [n for n, i in ospf_neighbors.items() if i["interface"] == interface],
+                    "link": key,
+                    "details": host_details[0].result
+                }
+            checked_interfaces.add(interface)
+    
+    analysis_results["links"] = links
     
     # Save results
     if timestamp:
@@ -107,7 +117,8 @@ def run_task(nr, timestamp=None):
             f.write("OSPF Analysis Summary\n")
             f.write("=" * 50 + "\n\n")
             
-            for host, results in analysis_results.items():
+            for host in nr.inventory.hosts:
+                results = analysis_results[host]
                 f.write(f"Device: {host}\n")
                 f.write("-" * 30 + "\n")
                 
@@ -123,5 +134,15 @@ def run_task(nr, timestamp=None):
                         f.write(f"- {interface}: {', '.join(info['neighbor_ips'])}\n")
                 
                 f.write("\n")
+            
+            if links:
+                f.write("Links\n")
+                f.write("-" * 30 + "\n")
+                for key, link in links.items():
+                    status = "✓" if link["healthy"] else "✗"
+                    f.write(f"{status} {key}")
+                    if link["investigate_from"]:
+                        f.write(f" (investigated from {link['investigate_from']})")
+                    f.write("\n")
     
     return analysis_results
\ No newline at end of file